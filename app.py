@@ -46,7 +46,7 @@ export_md = st.checkbox("Export Markdown", value=False)
 
 if st.button("Build / Refresh"):
     with st.spinner("Building monthly climate table..."):
-        df, provenance, csv_path, md_path = build_monthly_table(
+        result = build_monthly_table(
             location=location,
             sources_cfg=sources_cfg,
             params=params,
@@ -55,11 +55,14 @@ if st.button("Build / Refresh"):
             refresh=refresh,
             export_md=export_md,
         )
-
+    st.session_state.setdefault("results", {})[location.location_id] = result
     st.success("Completed!")
 
-    display_df = df.copy()
-    display_df = display_df[
+result = st.session_state.get("results", {}).get(location.location_id)
+if result is not None:
+    df, provenance, csv_path, md_path = result
+
+    display_df = df[
         [
             "Country",
             "Resort",
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import os
+import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Callable, Dict, Optional
+
+import numpy as np
+
+from src import jsonio
 
 
 class DiskCache:
@@ -14,27 +19,73 @@ class DiskCache:
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def _hash_key(self, key: str) -> str:
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
 
-    def _path_for(self, namespace: str, key: str) -> Path:
+    def _path_for(self, namespace: str, key: str, suffix: str = ".json") -> Path:
         safe_namespace = namespace.replace("/", "_")
-        return self.base_dir / safe_namespace / f"{self._hash_key(key)}.json"
+        return self.base_dir / safe_namespace / f"{self._hash_key(key)}{suffix}"
 
-    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
-        path = self._path_for(namespace, key)
-        if not path.exists():
-            return None
+    def _fresh_path(
+        self, namespace: str, key: str, suffix: str, allow_expired: bool = False
+    ) -> Optional[Path]:
+        path = self._path_for(namespace, key, suffix)
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
             return None
-        ts = payload.get("timestamp", 0)
-        if self.ttl_seconds and time.time() - ts > self.ttl_seconds:
+        if not allow_expired and self.ttl_seconds and time.time() - mtime > self.ttl_seconds:
+            return None
+        return path
+
+    def get(self, namespace: str, key: str, allow_expired: bool = False) -> Optional[Dict[str, Any]]:
+        path = self._fresh_path(namespace, key, ".json", allow_expired)
+        if path is None:
+            return None
+        try:
+            return jsonio.loads(path.read_bytes())
+        except (OSError, ValueError):
             return None
-        return payload.get("data")
 
     def set(self, namespace: str, key: str, data: Dict[str, Any]) -> None:
-        path = self._path_for(namespace, key)
+        payload = jsonio.dumps(data)
+        self._write_atomic(self._path_for(namespace, key), lambda handle: handle.write(payload))
+
+    def get_arrays(
+        self, namespace: str, key: str, allow_expired: bool = False
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Read a columnar entry written by ``set_arrays``; None when missing, expired or corrupt.
+
+        ``allow_expired`` also returns entries past the TTL, e.g. to revalidate them upstream.
+        """
+        path = self._fresh_path(namespace, key, ".npz", allow_expired)
+        if path is None:
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                return {name: archive[name] for name in archive.files}
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+
+    def set_arrays(self, namespace: str, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        """Store typed NumPy columns (uncompressed ``.npz``) so hits skip JSON parsing."""
+        self._write_atomic(
+            self._path_for(namespace, key, ".npz"), lambda handle: np.savez(handle, **arrays)
+        )
+
+    def touch(self, namespace: str, key: str, suffix: str = ".json") -> None:
+        """Restart an entry's TTL without rewriting it, e.g. after the source answered 304."""
+        try:
+            os.utime(self._path_for(namespace, key, suffix))
+        except FileNotFoundError:
+            pass
+
+    def _write_atomic(self, path: Path, write: Callable[[IO[bytes]], Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"timestamp": time.time(), "data": data}
-        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                write(handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -1,57 +1,96 @@
 from __future__ import annotations
 
-from calendar import monthrange
-from typing import Tuple
+from typing import Dict, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 
+def year_month_keys(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    months_since_epoch = df["date"].to_numpy().astype("datetime64[M]").astype(np.int64)
+    years = pd.Series(months_since_epoch // 12 + 1970, index=df.index, name="year")
+    months = pd.Series(months_since_epoch % 12 + 1, index=df.index, name="month")
+    return years, months
+
+
 def monthly_mean_from_daily(
     df: pd.DataFrame,
     value_col: str,
     min_coverage: float,
     start_year: int | None = None,
     end_year: int | None = None,
+    keys: Tuple[pd.Series, pd.Series] | None = None,
 ) -> Tuple[pd.Series, pd.Series]:
-    df = df.copy()
-    df["month"] = df["date"].dt.month
-    df["year"] = df["date"].dt.year
+    return monthly_mean_from_daily_multi(
+        df,
+        [value_col],
+        min_coverage,
+        start_year=start_year,
+        end_year=end_year,
+        keys=keys,
+    )[value_col]
+
+
+def monthly_mean_from_daily_multi(
+    df: pd.DataFrame,
+    value_cols: Sequence[str],
+    min_coverage: float,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    keys: Tuple[pd.Series, pd.Series] | None = None,
+) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+    if keys is None:
+        keys = year_month_keys(df)
+    years = np.asarray(keys[0], dtype=np.int64)
+    month_numbers = np.asarray(keys[1], dtype=np.int64)
 
-    grouped = df.groupby(["year", "month"])[value_col]
-    monthly_mean = grouped.mean().rename(value_col).reset_index()
+    first_year = int(years.min()) if len(years) else 0
+    n_years = int(years.max()) - first_year + 1 if len(years) else 0
+    codes = (years - first_year) * 12 + month_numbers - 1
 
     if start_year is None:
-        start_year = int(df["year"].min()) if not df.empty else None
+        start_year = first_year if len(years) else None
     if end_year is None:
-        end_year = int(df["year"].max()) if not df.empty else None
+        end_year = first_year + n_years - 1 if len(years) else None
 
-    coverage_rows = []
+    months = pd.Index(range(1, 13), name="month")
+    span_rows = None
     if start_year is not None and end_year is not None:
-        counts = grouped.count()
-        for year in range(start_year, end_year + 1):
-            for month in range(1, 13):
-                total_days = monthrange(year, month)[1]
-                valid_days = float(counts.get((year, month), 0))
-                coverage_rows.append(
-                    {"year": year, "month": month, "coverage": valid_days / total_days}
-                )
-    else:
-        for (year, month), values in grouped:
-            total_days = monthrange(year, month)[1]
-            valid_days = values.notna().sum()
-            coverage_rows.append({"year": year, "month": month, "coverage": valid_days / total_days})
-    coverage = pd.DataFrame(coverage_rows)
-
-    month_stats = pd.DataFrame()
-    if not monthly_mean.empty:
-        month_stats[value_col] = monthly_mean.groupby("month")[value_col].mean()
-    if not coverage.empty:
-        month_stats["coverage"] = coverage.groupby("month")["coverage"].mean()
-    if "coverage" not in month_stats:
-        month_stats["coverage"] = pd.Series(dtype="float64")
-    month_stats["coverage_ok"] = month_stats["coverage"] >= min_coverage
+        span = np.arange(start_year, end_year + 1)
+        span_rows = span - first_year
+        days = _days_in_month(np.repeat(span, 12), np.tile(np.arange(1, 13), len(span)))
+        days = days.reshape(len(span), 12)
 
-    months = pd.Index(range(1, 13), name="month")
-    month_stats = month_stats.reindex(months)
-    month_stats["coverage_ok"] = month_stats["coverage_ok"].fillna(False)
-    return month_stats[value_col], month_stats["coverage_ok"]
+    results: Dict[str, Tuple[pd.Series, pd.Series]] = {}
+    for value_col in value_cols:
+        values = df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        sums, counts = _year_month_sums(codes, values, n_years)
+
+        present = counts > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            yearly_means = sums / counts
+            monthly = np.where(present, yearly_means, 0.0).sum(axis=0) / present.sum(axis=0)
+        means = pd.Series(monthly.astype(np.float32), index=months, name=value_col)
+
+        coverage = pd.Series(np.nan, index=months)
+        if span_rows is not None:
+            in_data = (span_rows >= 0) & (span_rows < n_years)
+            span_counts = np.zeros(days.shape)
+            span_counts[in_data] = counts[span_rows[in_data]]
+            coverage[:] = (span_counts / days).mean(axis=0)
+        results[value_col] = (means, (coverage >= min_coverage).rename("coverage_ok"))
+    return results
+
+
+def _year_month_sums(codes: np.ndarray, values: np.ndarray, n_years: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-(year, month) sum and count of non-NaN values as (n_years, 12) arrays."""
+    valid = ~np.isnan(values)
+    size = n_years * 12
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=size).reshape(n_years, 12)
+    counts = np.bincount(codes[valid], minlength=size).reshape(n_years, 12)
+    return sums, counts
+
+
+def _days_in_month(years: np.ndarray, months: np.ndarray) -> np.ndarray:
+    first = ((years.astype("int64") - 1970) * 12 + months.astype("int64") - 1).astype("datetime64[M]")
+    return ((first + 1).astype("datetime64[D]") - first.astype("datetime64[D]")).astype("int64")
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Dict
+
+import numpy as np
 import pandas as pd
 
 
@@ -7,12 +10,35 @@ def apply_coverage_flags(
     series: pd.Series,
     coverage_ok: pd.Series,
     estimated: pd.Series | None = None,
+) -> pd.DataFrame:
+    batch = apply_coverage_flags_batch(
+        {"value": series},
+        {"value": coverage_ok},
+        estimated=None if estimated is None else {"value": estimated},
+    )
+    return pd.DataFrame({"value": batch["value"], "flag": batch["flag_value"]})
+
+
+def apply_coverage_flags_batch(
+    values: Dict[str, pd.Series],
+    coverage_ok: Dict[str, pd.Series],
+    estimated: Dict[str, pd.Series] | None = None,
 ) -> pd.DataFrame:
     months = pd.Index(range(1, 13), name="month")
-    aligned_series = series.reindex(months)
-    aligned_coverage = coverage_ok.reindex(months).fillna(False)
-    flags = (~aligned_coverage) | aligned_series.isna()
-    if estimated is not None:
-        aligned_estimated = estimated.reindex(months).fillna(False)
-        flags = flags | aligned_estimated
-    return pd.DataFrame({"value": aligned_series, "flag": flags.astype(int)})
+    values_df = pd.DataFrame(values).reindex(index=months, columns=list(values))
+    coverage_df = (
+        pd.DataFrame(coverage_ok)
+        .reindex(index=months, columns=list(values))
+        .fillna(False)
+        .astype(bool)
+    )
+    flags = (~coverage_df) | values_df.isna()
+    if estimated:
+        estimated_df = (
+            pd.DataFrame(estimated)
+            .reindex(index=months, columns=list(values))
+            .fillna(False)
+            .astype(bool)
+        )
+        flags = flags | estimated_df
+    return values_df.join(flags.astype(np.int8).add_prefix("flag_"))
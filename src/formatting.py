@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import math
 
+import numpy as np
+import pandas as pd
+
+_DECIMAL_COMMA = str.maketrans(".", ",")
+_FORMATTERS = {decimals: f"{{:.{decimals}f}}".format for decimals in range(5)}
+
+
+def _formatter(decimals: int) -> Callable[[Any], str]:
+    formatter = _FORMATTERS.get(decimals)
+    if formatter is None:
+        formatter = f"{{:.{decimals}f}}".format
+    return formatter
+
 
 def format_decimal(value: Any, decimals: int = 1) -> str:
     if value is None:
@@ -11,9 +24,8 @@ def format_decimal(value: Any, decimals: int = 1) -> str:
     if isinstance(value, float) and math.isnan(value):
         return ""
     if isinstance(value, (float, int)):
-        fmt = f"{value:.{decimals}f}"
-        return fmt.replace(".", ",")
-    return str(value).replace(".", ",")
+        return _formatter(decimals)(value).translate(_DECIMAL_COMMA)
+    return str(value).translate(_DECIMAL_COMMA)
 
 
 def format_with_flag(value: Any, flag: int, decimals: int = 1) -> str:
@@ -21,3 +33,12 @@ def format_with_flag(value: Any, flag: int, decimals: int = 1) -> str:
     if not formatted:
         return ""
     return f"+{formatted}" if flag else formatted
+
+
+def format_series_with_flag(values: pd.Series, flags: pd.Series, decimals: int = 1) -> pd.Series:
+    raw = values.to_numpy(dtype=float)
+    missing = np.isnan(raw)
+    formatted = np.char.replace(np.char.mod(f"%.{decimals}f", raw), ".", ",")
+    prefix = np.where(flags.to_numpy().astype(bool), "+", "")
+    result = np.where(missing, "", np.char.add(prefix, formatted))
+    return pd.Series(result.astype(object), index=values.index)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, NamedTuple, Optional
 
 
 @dataclass(frozen=True)
@@ -45,7 +45,37 @@ class Location:
         )
 
 
+class Thresholds(NamedTuple):
+    S0: float
+    S4: float
+    dS: float
+    ColdAirT: float
+    HeatAirT: float
+    BreezeW0: float
+    BreezeW1: float
+    BreezeRamp: float
+    CalmWindT: float
+    BreathAirT: float
+    BreathRainT: float
+    BreathWindT: float
+    StrongWindT: float
+    WindColdT: float
+    RainT1: float
+    RainT2: float
+    WaveT1: float
+    WaveT2: float
+    WaveT3: float
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Thresholds":
+        return cls(*(float(data[name]) for name in cls._fields))
+
+
 @dataclass(frozen=True)
 class Params:
     score: Dict[str, Any]
     thresholds: Dict[str, Any]
+    compiled: Thresholds = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "compiled", Thresholds.from_dict(self.thresholds))
@@ -1,25 +1,43 @@
 from __future__ import annotations
 
+import copy
+import json
+import math
+import os
+from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple, Optional, Callable, Iterable, List
 
+import numpy as np
 import pandas as pd
 import yaml
-import json
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+from src import jsonio
 from src.cache import DiskCache
-from src.compute.aggregate import monthly_mean_from_daily
-from src.compute.quality import apply_coverage_flags
+from src.compute.aggregate import monthly_mean_from_daily, monthly_mean_from_daily_multi, year_month_keys
+from src.compute.quality import apply_coverage_flags_batch
 from src.models import Location, Params
-from src.formatting import format_with_flag
+from src.formatting import format_series_with_flag
 from src.report.export_csv import export_csv
-from src.report.export_md import export_md
-from src.score.comfort import compute_score
-from src.sources.air_rain_meteostat import fetch_air_rain_daily
-from src.sources.sea_sst_erddap import fetch_sea_surface_temperature
+from src.report.export_md import export_md as write_markdown
+from src.score.comfort import compute_score_vec
+from src.sources.air_rain_meteostat import fetch_air_rain_daily, fetch_air_rain_daily_batch
+from src.sources.sea_sst_erddap import (
+    fetch_sea_surface_temperature,
+    fetch_sea_surface_temperature_batch,
+)
 from src.sources.wind_wave_openmeteo import OpenMeteoWindWave
 from src.sources.wind_wave_era5 import Era5WindWave
+from src.sources.wind_wave_provider import WindWaveProvider
 from src.sources.utils import format_error
 
 
@@ -29,24 +47,51 @@ AIR_RAIN_PROVIDERS: Dict[str, Callable[..., Tuple[pd.DataFrame, Dict[str, object
 SEA_PROVIDERS: Dict[str, Callable[..., Tuple[pd.DataFrame, Dict[str, object]]]] = {
     "open_meteo_marine": fetch_sea_surface_temperature,
 }
-WIND_WAVE_PROVIDERS: Dict[str, Callable[[], OpenMeteoWindWave]] = {
-    "open_meteo": OpenMeteoWindWave,
-    "era5": Era5WindWave,
+# Multi-location variants of the providers above, used to warm the caches for a whole chunk.
+AIR_RAIN_BATCH_PROVIDERS: Dict[str, Callable[..., List[Tuple[pd.DataFrame, Dict[str, object]]]]] = {
+    "open_meteo_archive": fetch_air_rain_daily_batch,
 }
+SEA_BATCH_PROVIDERS: Dict[str, Callable[..., List[Tuple[pd.DataFrame, Dict[str, object]]]]] = {
+    "open_meteo_marine": fetch_sea_surface_temperature_batch,
+}
+WIND_WAVE_PROVIDERS: Dict[str, WindWaveProvider] = {
+    "open_meteo": OpenMeteoWindWave(),
+    "era5": Era5WindWave(),
+}
+
+RESULT_NAMESPACE = "monthly_table"
+
+# (display column, numeric column, flag column, decimals)
+DISPLAY_COLUMNS: Tuple[Tuple[str, str, str, int], ...] = (
+    ("AirTempC", "AirTempC_num", "mark_air", 1),
+    ("SeaTempC", "SeaTempC_num", "mark_sea", 1),
+    ("RainDays", "RainDays_num", "mark_rain", 0),
+    ("Wind_ms", "Wind_ms_num", "mark_wind", 1),
+    ("WaveHs_m", "WaveHs_m_num", "mark_wave", 1),
+)
 
 
 def load_locations(path: Path) -> list[Location]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = _read_yaml(path)
     return [Location.from_dict(item) for item in data.get("locations", [])]
 
 
 def load_params(path: Path) -> Params:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = _read_yaml(path)
     return Params(score=data["score"], thresholds=data["thresholds"])
 
 
 def load_sources(path: Path) -> Dict[str, Dict[str, object]]:
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    return _read_yaml(path)
+
+
+def _read_yaml(path: Path) -> Dict[str, object]:
+    return copy.deepcopy(_load_yaml(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, object]:
+    return yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
 
 
 def build_monthly_table(
@@ -57,6 +102,8 @@ def build_monthly_table(
     outputs_dir: Path,
     refresh: bool = False,
     export_md: bool = False,
+    cache: Optional[DiskCache] = None,
+    providers: Optional[Dict[str, Dict[str, object]]] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, object], Path, Optional[Path]]:
     period = sources_cfg["period"]
     start_date = date(int(period["start_year"]), 1, 1)
@@ -67,38 +114,52 @@ def build_monthly_table(
     allow_last_resort = bool(fallbacks.get("allow_last_resort", False))
     mm_per_rain_day_proxy = float(fallbacks.get("mm_per_rain_day_proxy", 5.0))
 
-    cache = DiskCache(cache_dir, ttl_days=int(sources_cfg["cache"]["ttl_days"]))
+    if cache is None:
+        cache = _get_cache(str(cache_dir), int(sources_cfg["cache"]["ttl_days"]))
+    providers = providers or {}
 
-    air_df, air_meta = _fetch_with_fallbacks(
-        "air_rain",
-        sources_cfg["sources"]["air_rain"]["primary"],
-        sources_cfg["sources"]["air_rain"].get("fallbacks", []),
-        location,
-        start_date,
-        end_date,
-        cache,
-        refresh,
-    )
-    sea_df, sea_meta = _fetch_with_fallbacks(
-        "sea_temp",
-        sources_cfg["sources"]["sea_temp"]["primary"],
-        sources_cfg["sources"]["sea_temp"].get("fallbacks", []),
-        location,
-        start_date,
-        end_date,
-        cache,
-        refresh,
-    )
-    wind_wave_df, wind_meta = _fetch_with_fallbacks(
-        "wind_wave",
-        sources_cfg["sources"]["wind_wave"]["primary"],
-        sources_cfg["sources"]["wind_wave"].get("fallbacks", []),
-        location,
-        start_date,
-        end_date,
-        cache,
-        refresh,
-    )
+    period_label = f"{start_date.year}-{end_date.year}"
+    csv_path = outputs_dir / f"{location.location_id}_{period_label}_monthly.csv"
+    md_path: Optional[Path] = None
+    if export_md:
+        md_path = outputs_dir / f"{location.location_id}_{period_label}_monthly.md"
+    prov_path = outputs_dir / f"{location.location_id}_{period_label}_provenance.json"
+
+    result_key = _result_cache_key(location, sources_cfg, params)
+    if not refresh:
+        cached = _load_cached_result(cache, result_key)
+        if cached is not None:
+            df, provenance = cached
+            # Output paths don't depend on sources/params, so rewrite them from this entry.
+            _write_outputs(df, provenance, csv_path, md_path, prov_path)
+            return df, provenance, csv_path, md_path
+
+    sources = sources_cfg["sources"]
+    fetch_specs = [
+        (kind, sources[kind]["primary"], sources[kind].get("fallbacks", []))
+        for kind in ("air_rain", "sea_temp", "wind_wave")
+    ]
+    with ThreadPoolExecutor(max_workers=len(fetch_specs)) as executor:
+        futures = [
+            executor.submit(
+                _fetch_with_fallbacks,
+                kind,
+                providers.get(kind) or _provider_registry(kind),
+                primary,
+                provider_fallbacks,
+                location,
+                start_date,
+                end_date,
+                cache,
+                refresh,
+            )
+            for kind, primary, provider_fallbacks in fetch_specs
+        ]
+        (air_df, air_meta), (sea_df, sea_meta), (wind_wave_df, wind_meta) = [
+            future.result() for future in futures
+        ]
+
+    air_keys = year_month_keys(air_df)
 
     air_mean, air_cov = monthly_mean_from_daily(
         air_df,
@@ -106,6 +167,7 @@ def build_monthly_table(
         min_coverage,
         start_year=start_date.year,
         end_year=end_date.year,
+        keys=air_keys,
     )
     rain_days, rain_cov, rain_estimated = _build_rain_days(
         air_df,
@@ -114,6 +176,7 @@ def build_monthly_table(
         min_coverage,
         allow_estimated_rain_days,
         mm_per_rain_day_proxy,
+        keys=air_keys,
     )
 
     sea_mean, sea_cov = monthly_mean_from_daily(
@@ -123,20 +186,15 @@ def build_monthly_table(
         start_year=start_date.year,
         end_year=end_date.year,
     )
-    wind_mean, wind_cov = monthly_mean_from_daily(
-        wind_wave_df,
-        "wind_ms",
-        min_coverage,
-        start_year=start_date.year,
-        end_year=end_date.year,
-    )
-    wave_mean, wave_cov = monthly_mean_from_daily(
+    wind_wave_stats = monthly_mean_from_daily_multi(
         wind_wave_df,
-        "wave_hs_m",
+        ["wind_ms", "wave_hs_m"],
         min_coverage,
         start_year=start_date.year,
         end_year=end_date.year,
     )
+    wind_mean, wind_cov = wind_wave_stats["wind_ms"]
+    wave_mean, wave_cov = wind_wave_stats["wave_hs_m"]
 
     air_meta["coverage"] = air_cov.to_dict()
     sea_meta["coverage"] = sea_cov.to_dict()
@@ -145,25 +203,37 @@ def build_monthly_table(
         wind_meta["components"]["wind"]["coverage"] = wind_cov.to_dict()
         wind_meta["components"]["wave"]["coverage"] = wave_cov.to_dict()
 
-    air = apply_coverage_flags(air_mean, air_cov)
-    rain = apply_coverage_flags(rain_days, rain_cov, estimated=rain_estimated)
-    sea = apply_coverage_flags(sea_mean, sea_cov)
-    wind = apply_coverage_flags(wind_mean, wind_cov)
-    wave = apply_coverage_flags(wave_mean, wave_cov)
+    flagged = apply_coverage_flags_batch(
+        {
+            "air": air_mean,
+            "sea": sea_mean,
+            "rain": rain_days,
+            "wind": wind_mean,
+            "wave": wave_mean,
+        },
+        {
+            "air": air_cov,
+            "sea": sea_cov,
+            "rain": rain_cov,
+            "wind": wind_cov,
+            "wave": wave_cov,
+        },
+        estimated={"rain": rain_estimated},
+    )
 
     months = pd.Index(range(1, 13), name="Month")
     df = pd.DataFrame(index=months)
-    df["AirTempC_num"] = air["value"]
-    df["SeaTempC_num"] = sea["value"]
-    df["RainDays_num"] = rain["value"]
-    df["Wind_ms_num"] = wind["value"]
-    df["WaveHs_m_num"] = wave["value"]
-
-    df["mark_air"] = air["flag"]
-    df["mark_sea"] = sea["flag"]
-    df["mark_rain"] = rain["flag"]
-    df["mark_wind"] = wind["flag"]
-    df["mark_wave"] = wave["flag"]
+    df["AirTempC_num"] = flagged["air"]
+    df["SeaTempC_num"] = flagged["sea"]
+    df["RainDays_num"] = flagged["rain"]
+    df["Wind_ms_num"] = flagged["wind"]
+    df["WaveHs_m_num"] = flagged["wave"]
+
+    df["mark_air"] = flagged["flag_air"]
+    df["mark_sea"] = flagged["flag_sea"]
+    df["mark_rain"] = flagged["flag_rain"]
+    df["mark_wind"] = flagged["flag_wind"]
+    df["mark_wave"] = flagged["flag_wave"]
 
     last_resort_flags = {
         "AirTempC": pd.Series(False, index=months),
@@ -174,28 +244,24 @@ def build_monthly_table(
     }
     if allow_last_resort:
         last_resort_flags = _apply_last_resort(df)
+    for _, num_col, flag_col, _ in DISPLAY_COLUMNS:
+        df[num_col] = df[num_col].astype(np.float32)
+        df[flag_col] = df[flag_col].astype(np.int8)
+
+    scores, components = compute_score_vec(
+        df["AirTempC_num"].to_numpy(),
+        df["SeaTempC_num"].to_numpy(),
+        df["RainDays_num"].to_numpy(),
+        df["Wind_ms_num"].to_numpy(),
+        df["WaveHs_m_num"].to_numpy(),
+        {"score": params.score, "thresholds": params.compiled},
+    )
+    for name, values in components.items():
+        df[name] = values
 
-    scores = []
-    components_rows = []
-    for month, row in df.iterrows():
-        score, components = compute_score(
-            row["AirTempC_num"],
-            row["SeaTempC_num"],
-            row["RainDays_num"],
-            row["Wind_ms_num"],
-            row["WaveHs_m_num"],
-            {"score": params.score, "thresholds": params.thresholds},
-        )
-        scores.append(score)
-        components_rows.append(components)
-
-    components_df = pd.DataFrame(components_rows, index=months)
-    df = pd.concat([df, components_df], axis=1)
-
-    score_series = pd.Series(scores, index=months)
     rounding = float(params.score.get("rounding", 0.1))
-    df["Score"] = score_series
-    df["ComfortScore"] = (score_series / rounding).round() * rounding
+    df["Score"] = scores
+    df["ComfortScore"] = np.round(scores / rounding) * rounding
 
     df = df.reset_index()
     df.insert(0, "Area", location.area)
@@ -212,22 +278,8 @@ def build_monthly_table(
     df["wind_source"] = wind_source
     df["wave_source"] = wave_source
 
-    df["AirTempC"] = [
-        format_with_flag(val, flag) for val, flag in zip(df["AirTempC_num"], df["mark_air"])
-    ]
-    df["SeaTempC"] = [
-        format_with_flag(val, flag) for val, flag in zip(df["SeaTempC_num"], df["mark_sea"])
-    ]
-    df["RainDays"] = [
-        format_with_flag(val, flag, decimals=0)
-        for val, flag in zip(df["RainDays_num"], df["mark_rain"])
-    ]
-    df["Wind_ms"] = [
-        format_with_flag(val, flag) for val, flag in zip(df["Wind_ms_num"], df["mark_wind"])
-    ]
-    df["WaveHs_m"] = [
-        format_with_flag(val, flag) for val, flag in zip(df["WaveHs_m_num"], df["mark_wave"])
-    ]
+    for display_col, num_col, flag_col, decimals in DISPLAY_COLUMNS:
+        df[display_col] = format_series_with_flag(df[num_col], df[flag_col], decimals=decimals)
 
     if not allow_last_resort:
         missing = df[
@@ -242,14 +294,6 @@ def build_monthly_table(
         if missing.any().any():
             raise ValueError("Missing monthly data; last-resort estimates are disabled.")
 
-    period_label = f"{start_date.year}-{end_date.year}"
-    csv_path = outputs_dir / f"{location.location_id}_{period_label}_monthly.csv"
-    export_csv(df, csv_path)
-    md_path: Optional[Path] = None
-    if export_md:
-        md_path = outputs_dir / f"{location.location_id}_{period_label}_monthly.md"
-        export_md(df, md_path)
-
     marks_detail = _build_marks_detail(df, rain_estimated, min_coverage, last_resort_flags)
     provenance = {
         "location_id": location.location_id,
@@ -272,20 +316,182 @@ def build_monthly_table(
         },
         "marks": marks_detail,
     }
-    prov_path = outputs_dir / f"{location.location_id}_{period_label}_provenance.json"
-    prov_path.write_text(json.dumps(provenance, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_outputs(df, provenance, csv_path, md_path, prov_path)
+    cache.set(RESULT_NAMESPACE, result_key, {**_table_payload(df), "provenance": provenance})
 
     return df, provenance, csv_path, md_path
 
 
-def _average_days_per_month(start_year: int, end_year: int) -> pd.Series:
-    days = []
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            days.append({"year": year, "month": month, "days": pd.Period(f"{year}-{month}").days_in_month})
-    days_df = pd.DataFrame(days)
-    avg_days = days_df.groupby("month")["days"].mean()
-    return avg_days
+def build_monthly_tables(
+    locations: Iterable[Location],
+    sources_cfg: Dict[str, Dict[str, object]],
+    params: Params,
+    cache_dir: Path,
+    outputs_dir: Path,
+    refresh: bool = False,
+    export_md: bool = False,
+    n_jobs: Optional[int] = None,
+) -> List[Tuple[pd.DataFrame, Dict[str, object], Path, Optional[Path]]]:
+    locations = list(locations)
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(locations))
+    if n_jobs <= 1:
+        return _build_chunk(locations, sources_cfg, params, cache_dir, outputs_dir, refresh, export_md)
+
+    chunk_size = math.ceil(len(locations) / n_jobs)
+    chunks = [locations[i : i + chunk_size] for i in range(0, len(locations), chunk_size)]
+    results: List[Tuple[pd.DataFrame, Dict[str, object], Path, Optional[Path]]] = []
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [
+            executor.submit(
+                _build_chunk,
+                chunk,
+                sources_cfg,
+                params,
+                cache_dir,
+                outputs_dir,
+                refresh,
+                export_md,
+            )
+            for chunk in chunks
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+def _build_chunk(
+    locations: List[Location],
+    sources_cfg: Dict[str, Dict[str, object]],
+    params: Params,
+    cache_dir: Path,
+    outputs_dir: Path,
+    refresh: bool,
+    export_md: bool,
+) -> List[Tuple[pd.DataFrame, Dict[str, object], Path, Optional[Path]]]:
+    cache = DiskCache(cache_dir, ttl_days=int(sources_cfg["cache"]["ttl_days"]))
+    if not refresh and len(locations) > 1:
+        _prefetch_sources(locations, sources_cfg, cache)
+    return [
+        build_monthly_table(
+            location=location,
+            sources_cfg=sources_cfg,
+            params=params,
+            cache_dir=cache_dir,
+            outputs_dir=outputs_dir,
+            refresh=refresh,
+            export_md=export_md,
+            cache=cache,
+        )
+        for location in locations
+    ]
+
+
+def _prefetch_sources(
+    locations: List[Location],
+    sources_cfg: Dict[str, Dict[str, object]],
+    cache: DiskCache,
+) -> None:
+    """Warm the source caches for a chunk with batched requests before the per-location builds.
+
+    Best effort: anything that fails here is fetched, with fallbacks, by ``build_monthly_table``.
+    """
+    period = sources_cfg["period"]
+    start_date = date(int(period["start_year"]), 1, 1)
+    end_date = date(int(period["end_year"]), 12, 31)
+    sources = sources_cfg["sources"]
+    batches: List[Optional[Callable[..., object]]] = [
+        AIR_RAIN_BATCH_PROVIDERS.get(sources["air_rain"]["primary"]),
+        SEA_BATCH_PROVIDERS.get(sources["sea_temp"]["primary"]),
+    ]
+    wind_wave = WIND_WAVE_PROVIDERS.get(sources["wind_wave"]["primary"])
+    if wind_wave is not None:
+        batches.append(wind_wave.fetch_many)
+    for fetch_batch in filter(None, batches):
+        try:
+            fetch_batch(locations, start_date, end_date, cache)
+        except Exception:  # noqa: BLE001
+            continue
+
+
+def _result_cache_key(
+    location: Location, sources_cfg: Dict[str, Dict[str, object]], params: Params
+) -> str:
+    return json.dumps(
+        [asdict(location), sources_cfg, params.score, params.thresholds],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _table_payload(df: pd.DataFrame) -> Dict[str, object]:
+    return {
+        "columns": df.columns.tolist(),
+        "dtypes": [str(dtype) for dtype in df.dtypes],
+        "data": df.to_numpy(dtype=object).tolist(),
+    }
+
+
+def _load_cached_result(
+    cache: DiskCache, key: str
+) -> Optional[Tuple[pd.DataFrame, Dict[str, object]]]:
+    payload = cache.get(RESULT_NAMESPACE, key)
+    if payload is None:
+        return None
+    try:
+        provenance = _restore_month_keys(payload["provenance"])
+        df = pd.DataFrame(payload["data"], columns=payload["columns"])
+        df = df.astype(dict(zip(payload["columns"], payload["dtypes"])))
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return df, provenance
+
+
+def _restore_month_keys(provenance: Dict[str, object]) -> Dict[str, object]:
+    """Give cached coverage dicts back the int month keys JSON turned into strings."""
+    provenance["coverage"] = {
+        name: _int_keys(coverage) for name, coverage in provenance["coverage"].items()
+    }
+    sources = provenance["sources"]
+    for kind in ("air_rain", "sea"):
+        sources[kind]["coverage"] = _int_keys(sources[kind]["coverage"])
+    wind_meta = sources["wind_wave"]
+    wind_meta["coverage"] = {
+        name: _int_keys(coverage) for name, coverage in wind_meta["coverage"].items()
+    }
+    for component in (wind_meta.get("components") or {}).values():
+        if isinstance(component, dict) and component.get("coverage") is not None:
+            component["coverage"] = _int_keys(component["coverage"])
+    return provenance
+
+
+def _int_keys(coverage: Optional[Dict[str, object]]) -> Optional[Dict[int, object]]:
+    if coverage is None:
+        return None
+    return {int(month): value for month, value in coverage.items()}
+
+
+def _write_outputs(
+    df: pd.DataFrame,
+    provenance: Dict[str, object],
+    csv_path: Path,
+    md_path: Optional[Path],
+    prov_path: Path,
+) -> None:
+    export_csv(df, csv_path)
+    if md_path is not None:
+        write_markdown(df, md_path)
+    prov_path.write_bytes(jsonio.dumps(provenance, indent=True))
+
+
+@lru_cache(maxsize=32)
+def _average_days_per_month(start_year: int, end_year: int) -> Tuple[float, ...]:
+    years = range(start_year, end_year + 1)
+    days = np.fromiter(
+        (monthrange(year, month)[1] for year in years for month in range(1, 13)),
+        dtype=np.int32,
+        count=len(years) * 12,
+    )
+    return tuple(days.reshape(-1, 12).mean(axis=0).tolist())
 
 
 def _build_rain_days(
@@ -295,28 +501,31 @@ def _build_rain_days(
     min_coverage: float,
     allow_estimated: bool,
     mm_per_rain_day_proxy: float,
+    keys: Optional[Tuple[pd.Series, pd.Series]] = None,
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
     months = pd.Index(range(1, 13), name="month")
-    rain_indicator = air_df.copy()
-    rain_indicator["rain_day"] = (rain_indicator["prcp_mm"] >= 1.0).astype(float)
+    if keys is None:
+        keys = year_month_keys(air_df)
+    rain_indicator = pd.DataFrame(
+        {"date": air_df["date"], "rain_day": (air_df["prcp_mm"] >= 1.0).astype(float)}
+    )
     rain_mean, rain_cov = monthly_mean_from_daily(
         rain_indicator,
         "rain_day",
         min_coverage,
         start_year=start_year,
         end_year=end_year,
+        keys=keys,
     )
-    rain_days = rain_mean * _average_days_per_month(start_year, end_year)
+    avg_days = pd.Series(_average_days_per_month(start_year, end_year), index=months, name="days")
+    rain_days = rain_mean * avg_days
     rain_days = rain_days.reindex(months)
     rain_cov = rain_cov.reindex(months)
     estimated = pd.Series(False, index=months)
 
     if allow_estimated and rain_days.isna().any():
-        totals = air_df.copy()
-        totals["month"] = totals["date"].dt.month
-        totals["year"] = totals["date"].dt.year
-        monthly_total = totals.groupby(["year", "month"])["prcp_mm"].sum().reset_index()
-        avg_total = monthly_total.groupby("month")["prcp_mm"].mean().reindex(months)
+        monthly_total = air_df["prcp_mm"].groupby(list(keys)).sum()
+        avg_total = monthly_total.groupby(level="month").mean().reindex(months)
         estimated_values = avg_total / mm_per_rain_day_proxy
         needs_estimate = rain_days.isna() & estimated_values.notna()
         rain_days = rain_days.where(~needs_estimate, estimated_values)
@@ -327,7 +536,6 @@ def _build_rain_days(
 
 
 def _fill_last_resort(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
-    series = series.copy()
     filled = series.interpolate(limit_direction="both")
     if filled.isna().any():
         mean_value = filled.mean(skipna=True)
@@ -357,6 +565,7 @@ def _apply_last_resort(df: pd.DataFrame) -> Dict[str, pd.Series]:
 
 def _fetch_with_fallbacks(
     source_kind: str,
+    registry: Dict[str, object],
     primary: str,
     fallbacks: Iterable[str],
     location: Location,
@@ -365,7 +574,6 @@ def _fetch_with_fallbacks(
     cache: DiskCache,
     refresh: bool,
 ) -> Tuple[pd.DataFrame, Dict[str, object]]:
-    registry = _provider_registry(source_kind)
     errors: List[Tuple[str, BaseException]] = []
     for provider_name in [primary, *list(fallbacks)]:
         if provider_name not in registry:
@@ -373,7 +581,7 @@ def _fetch_with_fallbacks(
         try:
             provider = registry[provider_name]
             if source_kind == "wind_wave":
-                df, meta = provider().fetch(location, start_date, end_date, cache, refresh)
+                df, meta = provider.fetch(location, start_date, end_date, cache, refresh)
             else:
                 df, meta = provider(location, start_date, end_date, cache, refresh)
         except Exception as exc:  # noqa: BLE001
@@ -385,7 +593,12 @@ def _fetch_with_fallbacks(
     raise errors[-1][1]
 
 
-def _provider_registry(source_kind: str) -> Dict[str, Callable[..., object]]:
+@lru_cache(maxsize=None)
+def _get_cache(cache_dir: str, ttl_days: int) -> DiskCache:
+    return DiskCache(Path(cache_dir), ttl_days=ttl_days)
+
+
+def _provider_registry(source_kind: str) -> Dict[str, object]:
     if source_kind == "air_rain":
         return AIR_RAIN_PROVIDERS
     if source_kind == "sea_temp":
@@ -403,11 +616,10 @@ def _annotate_fallback_meta(
     meta = dict(meta)
     meta["fallback_used"] = True
     meta["fallback_provider"] = provider_name
-    meta["fallbacks_tried"] = [
-        {"source": name, "error": format_error(error)} for name, error in errors
-    ]
-    if meta.get("error") is None and errors:
-        meta["error"] = format_error(errors[-1][1])
+    tried = [{"source": name, "error": format_error(error)} for name, error in errors]
+    meta["fallbacks_tried"] = tried
+    if meta.get("error") is None and tried:
+        meta["error"] = tried[-1]["error"]
     return meta
 
 
@@ -417,35 +629,22 @@ def _build_marks_detail(
     min_coverage: float,
     last_resort_flags: Dict[str, pd.Series],
 ) -> Dict[str, object]:
-    marks = {}
-    for month, row in df.iterrows():
-        month_marks = []
-        if row["mark_air"]:
-            reason = f"coverage_below_{min_coverage}"
-            if last_resort_flags["AirTempC"].loc[month]:
-                reason = "last_resort_estimate"
-            month_marks.append({"metric": "AirTempC", "reason": reason})
-        if row["mark_sea"]:
-            reason = f"coverage_below_{min_coverage}"
-            if last_resort_flags["SeaTempC"].loc[month]:
-                reason = "last_resort_estimate"
-            month_marks.append({"metric": "SeaTempC", "reason": reason})
-        if row["mark_rain"]:
-            reason = f"coverage_below_{min_coverage}"
-            if rain_estimated.loc[month]:
-                reason = "estimated_from_total"
-            if last_resort_flags["RainDays"].loc[month]:
-                reason = "last_resort_estimate"
-            month_marks.append({"metric": "RainDays", "reason": reason})
-        if row["mark_wind"]:
-            reason = f"coverage_below_{min_coverage}"
-            if last_resort_flags["Wind_ms"].loc[month]:
-                reason = "last_resort_estimate"
-            month_marks.append({"metric": "Wind_ms", "reason": reason})
-        if row["mark_wave"]:
-            reason = f"coverage_below_{min_coverage}"
-            if last_resort_flags["WaveHs_m"].loc[month]:
-                reason = "last_resort_estimate"
-            month_marks.append({"metric": "WaveHs_m", "reason": reason})
-        marks[str(month)] = month_marks
+    month_values = df["Month"].to_numpy()
+    month_keys = [str(month) for month in month_values]
+    marks: Dict[str, list] = {key: [] for key in month_keys}
+    coverage_reason = f"coverage_below_{min_coverage}"
+    for display_col, _, flag_col, _ in DISPLAY_COLUMNS:
+        mask = df[flag_col].to_numpy(dtype=bool)
+        if not mask.any():
+            continue
+        reasons = np.full(len(month_values), coverage_reason, dtype=object)
+        if display_col == "RainDays":
+            estimated = rain_estimated.reindex(month_values, fill_value=False).to_numpy(dtype=bool)
+            reasons[estimated] = "estimated_from_total"
+        last_resort = (
+            last_resort_flags[display_col].reindex(month_values, fill_value=False).to_numpy(dtype=bool)
+        )
+        reasons[last_resort] = "last_resort_estimate"
+        for i in np.flatnonzero(mask):
+            marks[month_keys[i]].append({"metric": display_col, "reason": reasons[i]})
     return marks
@@ -45,12 +45,11 @@ REQUIRED_COLUMNS = [
 ]
 
 
+_REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+
+
 def export_csv(df: pd.DataFrame, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    ordered_df = df.copy()
-    for column in REQUIRED_COLUMNS:
-        if column not in ordered_df.columns:
-            ordered_df[column] = ""
-    optional_columns = [column for column in ordered_df.columns if column not in REQUIRED_COLUMNS]
-    ordered_df = ordered_df[REQUIRED_COLUMNS + optional_columns]
+    optional_columns = [column for column in df.columns if column not in _REQUIRED_SET]
+    ordered_df = df.reindex(columns=REQUIRED_COLUMNS + optional_columns, fill_value="")
     ordered_df.to_csv(path, index=False, sep=";", encoding="utf-8-sig", decimal=",")
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.formatting import format_decimal
+
 
 DISPLAY_COLUMNS = [
     "Country",
@@ -22,5 +24,32 @@ DISPLAY_COLUMNS = [
 def export_md(df: pd.DataFrame, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     existing_columns = [column for column in DISPLAY_COLUMNS if column in df.columns]
-    md = df[existing_columns].to_markdown(index=False)
+    md = _to_markdown(df[existing_columns])
     path.write_text(md, encoding="utf-8")
+
+
+def _to_markdown(df: pd.DataFrame) -> str:
+    headers = [str(column) for column in df.columns]
+    columns = [[_format_cell(value) for value in df[column].tolist()] for column in df.columns]
+    numeric = [pd.api.types.is_numeric_dtype(df[column]) for column in df.columns]
+    widths = [max(len(header), 3, *map(len, cells)) for header, cells in zip(headers, columns)]
+
+    def _row(cells: list[str]) -> str:
+        padded = [
+            cell.rjust(width) if is_numeric else cell.ljust(width)
+            for cell, width, is_numeric in zip(cells, widths, numeric)
+        ]
+        return "| " + " | ".join(padded) + " |"
+
+    separator = "|" + "|".join(
+        "-" * (width + 1) + ":" if is_numeric else ":" + "-" * (width + 1)
+        for width, is_numeric in zip(widths, numeric)
+    ) + "|"
+    rows = [_row(list(cells)) for cells in zip(*columns)]
+    return "\n".join([_row(headers), separator, *rows])
+
+
+def _format_cell(value: object) -> str:
+    if isinstance(value, float):
+        return format_decimal(value, 1)
+    return str(value)
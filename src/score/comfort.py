@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
 
+import numpy as np
 
-def _clamp(value: float, min_value: float, max_value: float) -> float:
-    return max(min_value, min(max_value, value))
+from src.models import Thresholds
+
+
+def _thresholds(params: Dict[str, Any]) -> Thresholds:
+    thresholds = params["thresholds"]
+    if isinstance(thresholds, Thresholds):
+        return thresholds
+    return Thresholds.from_dict(thresholds)
 
 
 def _interp(x: float, x0: float, x1: float, y0: float, y1: float) -> float:
@@ -15,89 +22,225 @@ def _interp(x: float, x0: float, x1: float, y0: float, y1: float) -> float:
     return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
 
 
+def _interp_vec(x: np.ndarray, x0: float, x1: float, y0: float, y1: float) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ramp = y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return np.where(x <= x0, y0, np.where(x >= x1, y1, ramp))
+
+
 def compute_score(
     air_c: float,
     sea_c: float,
     rain_days: float,
     wind_ms: float,
     wave_hs_m: float,
-    params: Dict[str, Dict[str, float]],
+    params: Dict[str, Any],
 ) -> Tuple[float, Dict[str, float]]:
-    thresholds = params["thresholds"]
+    (
+        s0,
+        s4,
+        d_s,
+        cold_air_t,
+        heat_air_t,
+        breeze_w0,
+        breeze_w1,
+        breeze_ramp,
+        calm_wind_t,
+        breath_air_t,
+        breath_rain_t,
+        breath_wind_t,
+        strong_wind_t,
+        wind_cold_t,
+        rain_t1,
+        rain_t2,
+        wave_t1,
+        wave_t2,
+        wave_t3,
+    ) = _thresholds(params)
     clamp_min = params["score"]["clamp_min"]
     clamp_max = params["score"]["clamp_max"]
 
-    sea_base = _interp(sea_c, thresholds["S0"], thresholds["S4"], 0, 100)
-    sea_base = _clamp(sea_base, 0, 100)
+    sea_base = max(0, min(100, _interp(sea_c, s0, s4, 0, 100)))
 
-    air_adj = -abs(air_c - sea_c) * thresholds["dS"]
+    air_adj = -abs(air_c - sea_c) * d_s
 
-    breeze = _interp(wind_ms, 0, thresholds["BreezeW0"], 0, 5)
+    breeze = _interp(wind_ms, 0, breeze_w0, 0, 5)
 
     warm_for_breeze = 0.0
-    if air_c > thresholds["HeatAirT"]:
-        warm_for_breeze = _interp(
-            air_c,
-            thresholds["HeatAirT"],
-            thresholds["HeatAirT"] + thresholds["dS"],
-            0,
-            5,
-        )
+    if air_c > heat_air_t:
+        warm_for_breeze = _interp(air_c, heat_air_t, heat_air_t + d_s, 0, 5)
 
     breeze_bonus = 0.0
-    if thresholds["BreezeW0"] < wind_ms < thresholds["BreezeW1"]:
-        breeze_bonus = (wind_ms - thresholds["BreezeW0"]) * thresholds["BreezeRamp"]
+    if breeze_w0 < wind_ms < breeze_w1:
+        breeze_bonus = (wind_ms - breeze_w0) * breeze_ramp
 
     cold = 0.0
-    if air_c < thresholds["ColdAirT"]:
-        cold = (thresholds["ColdAirT"] - air_c) * 2
+    if air_c < cold_air_t:
+        cold = (cold_air_t - air_c) * 2
 
     wind_ex_cold = 0.0
-    if air_c < thresholds["ColdAirT"] and wind_ms > thresholds["WindColdT"]:
-        wind_ex_cold = (wind_ms - thresholds["WindColdT"]) * 1.5
+    if air_c < cold_air_t and wind_ms > wind_cold_t:
+        wind_ex_cold = (wind_ms - wind_cold_t) * 1.5
 
-    rain_pen = _interp(rain_days, thresholds["RainT1"], thresholds["RainT2"], 0, 20)
-    rain_pen = _clamp(rain_pen, 0, 20)
+    rain_pen = max(0, min(20, _interp(rain_days, rain_t1, rain_t2, 0, 20)))
 
     wet_pen = 0.0
-    if rain_days > thresholds["RainT2"]:
-        wet_pen = (rain_days - thresholds["RainT2"]) * 0.5
+    if rain_days > rain_t2:
+        wet_pen = (rain_days - rain_t2) * 0.5
 
     heat_pen = 0.0
-    if air_c > thresholds["HeatAirT"] and wind_ms < thresholds["CalmWindT"]:
-        heat_pen = (air_c - thresholds["HeatAirT"]) * 1.5
+    if air_c > heat_air_t and wind_ms < calm_wind_t:
+        heat_pen = (air_c - heat_air_t) * 1.5
 
     breath_pen = 0.0
-    if (
-        air_c > thresholds["BreathAirT"]
-        and rain_days > thresholds["BreathRainT"]
-        and wind_ms < thresholds["BreathWindT"]
-    ):
+    if air_c > breath_air_t and rain_days > breath_rain_t and wind_ms < breath_wind_t:
         breath_pen = 10.0
 
     strong_wind_pen = 0.0
-    if wind_ms > thresholds["StrongWindT"]:
-        strong_wind_pen = (wind_ms - thresholds["StrongWindT"]) * 1.5
+    if wind_ms > strong_wind_t:
+        strong_wind_pen = (wind_ms - strong_wind_t) * 1.5
 
     wave_pen = 0.0
-    if wave_hs_m > thresholds["WaveT1"]:
-        if wave_hs_m <= thresholds["WaveT2"]:
-            wave_pen = _interp(
-                wave_hs_m,
-                thresholds["WaveT1"],
-                thresholds["WaveT2"],
-                0,
-                7.5,
-            )
+    if wave_hs_m > wave_t1:
+        if wave_hs_m <= wave_t2:
+            wave_pen = _interp(wave_hs_m, wave_t1, wave_t2, 0, 7.5)
         else:
-            wave_pen = _interp(
-                wave_hs_m,
-                thresholds["WaveT2"],
-                thresholds["WaveT3"],
-                7.5,
-                15,
-            )
-    wave_pen = _clamp(wave_pen, 0, 15)
+            wave_pen = _interp(wave_hs_m, wave_t2, wave_t3, 7.5, 15)
+    wave_pen = max(0, min(15, wave_pen))
+
+    score_raw = (
+        sea_base
+        + air_adj
+        + breeze
+        + warm_for_breeze
+        + breeze_bonus
+        - cold
+        - wind_ex_cold
+        - wet_pen
+        - rain_pen
+        - heat_pen
+        - breath_pen
+        - strong_wind_pen
+        - wave_pen
+    )
+
+    score = max(clamp_min, min(clamp_max, score_raw))
+
+    components = {
+        "SeaBase": sea_base,
+        "AirAdj": air_adj,
+        "Breeze": breeze,
+        "WarmForBreeze": warm_for_breeze,
+        "BreezeBonus": breeze_bonus,
+        "Cold": cold,
+        "WindExCold": wind_ex_cold,
+        "WetPen": wet_pen,
+        "RainPen": rain_pen,
+        "HeatPen": heat_pen,
+        "BreathPen": breath_pen,
+        "StrongWindPen": strong_wind_pen,
+        "WavePen": wave_pen,
+        "Score_raw": score_raw,
+    }
+    return score, components
+
+
+def compute_score_vec(
+    air_c: np.ndarray,
+    sea_c: np.ndarray,
+    rain_days: np.ndarray,
+    wind_ms: np.ndarray,
+    wave_hs_m: np.ndarray,
+    params: Dict[str, Any],
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    air_c = np.asarray(air_c, dtype=np.float64)
+    sea_c = np.asarray(sea_c, dtype=np.float64)
+    rain_days = np.asarray(rain_days, dtype=np.float64)
+    wind_ms = np.asarray(wind_ms, dtype=np.float64)
+    wave_hs_m = np.asarray(wave_hs_m, dtype=np.float64)
+    (
+        s0,
+        s4,
+        d_s,
+        cold_air_t,
+        heat_air_t,
+        breeze_w0,
+        breeze_w1,
+        breeze_ramp,
+        calm_wind_t,
+        breath_air_t,
+        breath_rain_t,
+        breath_wind_t,
+        strong_wind_t,
+        wind_cold_t,
+        rain_t1,
+        rain_t2,
+        wave_t1,
+        wave_t2,
+        wave_t3,
+    ) = _thresholds(params)
+    clamp_min = params["score"]["clamp_min"]
+    clamp_max = params["score"]["clamp_max"]
+
+    sea_base = np.clip(_interp_vec(sea_c, s0, s4, 0, 100), 0, 100)
+
+    air_adj = -np.abs(air_c - sea_c) * d_s
+
+    breeze = _interp_vec(wind_ms, 0, breeze_w0, 0, 5)
+
+    warm_for_breeze = np.where(
+        air_c > heat_air_t,
+        _interp_vec(air_c, heat_air_t, heat_air_t + d_s, 0, 5),
+        0.0,
+    )
+
+    breeze_bonus = np.where(
+        (breeze_w0 < wind_ms) & (wind_ms < breeze_w1),
+        (wind_ms - breeze_w0) * breeze_ramp,
+        0.0,
+    )
+
+    is_cold = air_c < cold_air_t
+    cold = np.where(is_cold, (cold_air_t - air_c) * 2, 0.0)
+
+    wind_ex_cold = np.where(
+        is_cold & (wind_ms > wind_cold_t),
+        (wind_ms - wind_cold_t) * 1.5,
+        0.0,
+    )
+
+    rain_pen = np.clip(_interp_vec(rain_days, rain_t1, rain_t2, 0, 20), 0, 20)
+
+    wet_pen = np.where(
+        rain_days > rain_t2,
+        (rain_days - rain_t2) * 0.5,
+        0.0,
+    )
+
+    heat_pen = np.where(
+        (air_c > heat_air_t) & (wind_ms < calm_wind_t),
+        (air_c - heat_air_t) * 1.5,
+        0.0,
+    )
+
+    breath_pen = np.where(
+        (air_c > breath_air_t) & (rain_days > breath_rain_t) & (wind_ms < breath_wind_t),
+        10.0,
+        0.0,
+    )
+
+    strong_wind_pen = np.where(
+        wind_ms > strong_wind_t,
+        (wind_ms - strong_wind_t) * 1.5,
+        0.0,
+    )
+
+    wave_pen = np.where(
+        wave_hs_m <= wave_t2,
+        _interp_vec(wave_hs_m, wave_t1, wave_t2, 0, 7.5),
+        _interp_vec(wave_hs_m, wave_t2, wave_t3, 7.5, 15),
+    )
+    wave_pen = np.clip(np.where(wave_hs_m > wave_t1, wave_pen, 0.0), 0, 15)
 
     score_raw = (
         sea_base
@@ -115,7 +258,7 @@ def compute_score(
         - wave_pen
     )
 
-    score = _clamp(score_raw, clamp_min, clamp_max)
+    score = np.clip(score_raw, clamp_min, clamp_max)
 
     components = {
         "SeaBase": sea_base,
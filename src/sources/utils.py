@@ -1,7 +1,62 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
-from typing import Iterable, Optional, Union, Dict
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, Dict
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src import jsonio
+from src.cache import DiskCache
+from src.models import Location
+
+ARCHIVE_ENDPOINT = "https://archive-api.open-meteo.com/v1/archive"
+MARINE_ENDPOINT = "https://marine-api.open-meteo.com/v1/marine"
+# Every archive consumer (air/rain and wind) asks for the same variable set, so one
+# request and one cache entry per location/period serve both.
+ARCHIVE_DAILY_VARIABLES = ("temperature_2m_max", "precipitation_sum", "wind_speed_10m_mean")
+
+HTTP_POOL_SIZE = 16
+MEMORY_CACHE_ENTRIES = 512
+MEMORY_CACHE_TTL_SECONDS = 3600
+MAX_FETCH_WORKERS = 8
+MAX_COORDINATES_PER_REQUEST = 50
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session for API calls, one per process."""
+    return _session_for_process(os.getpid())
+
+
+@lru_cache(maxsize=None)
+def _session_for_process(pid: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=HTTP_RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def build_cache_key(
@@ -14,15 +69,367 @@ def build_cache_key(
     end_date: date,
     variables: Union[str, Iterable[str]],
     units: str = "metric",
+    **extras: Any,
 ) -> str:
+    """Cache key for a source request; ``extras`` are folded in as an order-independent hash."""
     if isinstance(variables, str):
         variables_part = variables
     else:
         variables_part = ",".join(variables)
-    return (
+    key = (
         f"{source_name}:{source_version}:{location_id}:{lat}:{lon}:"
         f"{start_date.isoformat()}:{end_date.isoformat()}:{variables_part}:units={units}"
     )
+    if extras:
+        canonical = json.dumps(extras, sort_keys=True, separators=(",", ":"), default=str)
+        key += ":" + hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+    return key
+
+
+def fetch_daily(
+    endpoint: str,
+    source_name: str,
+    source_version: str,
+    namespace: str,
+    location_id: str,
+    lat: float,
+    lon: float,
+    start_date: date,
+    end_date: date,
+    variables: Sequence[str],
+    cache: DiskCache,
+    refresh: bool = False,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, object]]:
+    """Cache-first fetch of an Open-Meteo style ``daily`` payload; returns (payload, meta).
+
+    The payload's ``daily`` block is columnar: ``time`` as ``datetime64[D]`` and one float32
+    array per variable, stored in the cache as ``.npz`` so hits skip JSON parsing. The last
+    ``MEMORY_CACHE_ENTRIES`` payloads are also kept in process memory in front of the disk cache,
+    each for at most ``MEMORY_CACHE_TTL_SECONDS``.
+
+    The response's ``Last-Modified``/``ETag`` are kept next to the columns; a refresh, or a
+    lookup whose entry has expired, sends them back as a conditional request and a ``304``
+    reuses (and re-arms the TTL of) the stored columns as-is.
+
+    ``extra_params`` are sent with the request and become part of the cache key.
+    """
+    daily = ",".join(variables)
+    extra_params = extra_params or {}
+    cache_key = build_cache_key(
+        source_name, source_version, location_id, lat, lon, start_date, end_date, daily,
+        **extra_params,
+    )
+    coordinates = {"lat": lat, "lon": lon}
+    memory_key = (str(cache.base_dir), namespace, cache_key)
+    columns = _cached_columns(cache, memory_key)
+    cached = {"daily": columns} if columns is not None else None
+    if cached and not refresh:
+        return cached, build_source_meta(
+            source_name,
+            source_version,
+            start_date,
+            end_date,
+            coordinates,
+            cached=True,
+            cache_fallback=False,
+        )
+
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "daily": daily,
+        "timezone": "UTC",
+        **extra_params,
+    }
+
+    # An entry past its TTL is still worth revalidating: history rarely changes upstream.
+    revalidate = cached
+    if revalidate is None:
+        stale = cache.get_arrays(namespace, cache_key, allow_expired=True)
+        revalidate = {"daily": stale} if stale is not None else None
+
+    def _download() -> Tuple[Dict[str, Any], bool]:
+        headers = {}
+        if revalidate:
+            headers = _conditional_headers(cache.get(namespace, cache_key, allow_expired=True))
+        response = get_session().get(endpoint, params=params, headers=headers, timeout=60)
+        if response.status_code == 304 and revalidate:
+            cache.touch(namespace, cache_key, ".npz")
+            cache.touch(namespace, cache_key, ".json")
+            _memory_put(memory_key, revalidate["daily"])
+            return revalidate, True
+        response.raise_for_status()
+        try:
+            data = jsonio.loads(response.content)
+        except ValueError as exc:
+            # Keep invalid bodies a RequestException so the cache fallback still applies.
+            raise requests.exceptions.InvalidJSONError(str(exc), response=response) from exc
+        columns = _columnar(data, variables)
+        cache.set_arrays(namespace, cache_key, columns)
+        cache.set(namespace, cache_key, _validators(response.headers))
+        _memory_put(memory_key, columns)
+        return {"daily": columns}, False
+
+    try:
+        data, not_modified = _single_flight(f"{namespace}:{cache_key}", _download)
+    except requests.RequestException as exc:
+        if cached:
+            return cached, build_source_meta(
+                source_name,
+                source_version,
+                start_date,
+                end_date,
+                coordinates,
+                cached=True,
+                cache_fallback=True,
+                error=exc,
+            )
+        raise
+
+    return data, build_source_meta(
+        source_name,
+        source_version,
+        start_date,
+        end_date,
+        coordinates,
+        cached=not_modified,
+        cache_fallback=False,
+    )
+
+
+def _validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {
+        name: headers[name] for name in ("Last-Modified", "ETag") if headers.get(name)
+    }
+
+
+def _conditional_headers(validators: Optional[Dict[str, str]]) -> Dict[str, str]:
+    validators = validators or {}
+    headers = {}
+    if validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    if validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    return headers
+
+
+def fetch_daily_many(
+    endpoint: str,
+    source_name: str,
+    source_version: str,
+    namespace: str,
+    points: Sequence[Tuple[str, float, float]],
+    start_date: date,
+    end_date: date,
+    variables: Sequence[str],
+    cache: DiskCache,
+    refresh: bool = False,
+) -> List[Tuple[Dict[str, Any], Dict[str, object]]]:
+    """``fetch_daily`` for several ``(location_id, lat, lon)`` points, keeping input order.
+
+    Cache misses are fetched together, ``MAX_COORDINATES_PER_REQUEST`` coordinates per request,
+    and every point is cached under its own ``fetch_daily`` key together with the response's
+    ``Last-Modified``, so it can be revalidated later. Identical concurrent batches share one
+    request. When a batched request fails its points go through ``fetch_daily`` one by one, so
+    the usual cache fallback applies.
+    """
+    daily = ",".join(variables)
+    memory_keys = [
+        (
+            str(cache.base_dir),
+            namespace,
+            build_cache_key(
+                source_name, source_version, location_id, lat, lon, start_date, end_date, daily
+            ),
+        )
+        for location_id, lat, lon in points
+    ]
+    results: List[Optional[Tuple[Dict[str, Any], Dict[str, object]]]] = [None] * len(points)
+    if not refresh:
+        for index, memory_key in enumerate(memory_keys):
+            columns = _cached_columns(cache, memory_key)
+            if columns is not None:
+                meta = _point_meta(
+                    source_name, source_version, start_date, end_date, points[index], cached=True
+                )
+                results[index] = ({"daily": columns}, meta)
+
+    def _download(batch: List[int]) -> List[Dict[str, np.ndarray]]:
+        params = {
+            "latitude": ",".join(str(points[index][1]) for index in batch),
+            "longitude": ",".join(str(points[index][2]) for index in batch),
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "daily": daily,
+            "timezone": "UTC",
+        }
+        response = get_session().get(endpoint, params=params, timeout=60)
+        response.raise_for_status()
+        data = jsonio.loads(response.content)
+        # A single coordinate comes back as one object, several as a list in request order.
+        blocks = [data] if isinstance(data, dict) else list(data)
+        if len(blocks) != len(batch):
+            raise ValueError(f"expected {len(batch)} locations, got {len(blocks)}")
+        # The ETag covers the combined body and would never match a single-point request;
+        # Last-Modified still lets fetch_daily revalidate these entries one by one.
+        validators = {
+            name: value for name, value in _validators(response.headers).items() if name != "ETag"
+        }
+        batch_columns = []
+        for index, block in zip(batch, blocks):
+            memory_key = memory_keys[index]
+            columns = _columnar(block, variables)
+            cache.set_arrays(namespace, memory_key[2], columns)
+            cache.set(namespace, memory_key[2], validators)
+            _memory_put(memory_key, columns)
+            batch_columns.append(columns)
+        return batch_columns
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    for offset in range(0, len(missing), MAX_COORDINATES_PER_REQUEST):
+        batch = missing[offset : offset + MAX_COORDINATES_PER_REQUEST]
+        flight_key = f"{namespace}:" + "|".join(memory_keys[index][2] for index in batch)
+        try:
+            batch_columns = _single_flight(flight_key, lambda batch=batch: _download(batch))
+        except (requests.RequestException, ValueError, TypeError):
+            for index in batch:
+                location_id, lat, lon = points[index]
+                results[index] = fetch_daily(
+                    endpoint, source_name, source_version, namespace, location_id, lat, lon,
+                    start_date, end_date, variables, cache, refresh,
+                )
+            continue
+        for index, columns in zip(batch, batch_columns):
+            meta = _point_meta(
+                source_name, source_version, start_date, end_date, points[index], cached=False
+            )
+            results[index] = ({"daily": columns}, meta)
+    return results  # type: ignore[return-value]
+
+
+def _point_meta(
+    source_name: str,
+    source_version: str,
+    start_date: date,
+    end_date: date,
+    point: Tuple[str, float, float],
+    cached: bool,
+) -> Dict[str, object]:
+    return build_source_meta(
+        source_name,
+        source_version,
+        start_date,
+        end_date,
+        {"lat": point[1], "lon": point[2]},
+        cached=cached,
+        cache_fallback=False,
+    )
+
+
+def _cached_columns(
+    cache: DiskCache, memory_key: Tuple[str, str, str]
+) -> Optional[Dict[str, np.ndarray]]:
+    columns = _memory_get(memory_key)
+    if columns is None:
+        columns = cache.get_arrays(memory_key[1], memory_key[2])
+        if columns is not None:
+            _memory_put(memory_key, columns)
+    return columns
+
+
+_memory: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, np.ndarray]]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _memory_get(key: Tuple[str, str, str]) -> Optional[Dict[str, np.ndarray]]:
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is None:
+            return None
+        stored_at, columns = entry
+        # Past the TTL, fall through to the disk cache so its own TTL is honoured.
+        if time.monotonic() - stored_at > MEMORY_CACHE_TTL_SECONDS:
+            del _memory[key]
+            return None
+        _memory.move_to_end(key)
+        return columns
+
+
+def _memory_put(key: Tuple[str, str, str], columns: Dict[str, np.ndarray]) -> None:
+    # Entries are shared between callers, so freeze them against in-place edits.
+    for values in columns.values():
+        values.setflags(write=False)
+    with _memory_lock:
+        _memory[key] = (time.monotonic(), columns)
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_CACHE_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def _columnar(payload: Dict[str, Any], variables: Sequence[str]) -> Dict[str, np.ndarray]:
+    daily = payload.get("daily", {})
+    columns = {"time": np.asarray(daily.get("time", []), dtype="datetime64[D]")}
+    for variable in variables:
+        columns[variable] = _float32_array(daily.get(variable, []))
+    return columns
+
+
+def daily_arrays(
+    payload: Dict[str, Any], columns: Dict[str, str]
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Parse a daily payload into ``datetime64[D]`` dates and float32 value arrays keyed by column."""
+    daily = payload.get("daily", {})
+    dates = np.asarray(daily.get("time", []), dtype="datetime64[D]")
+    values = {column: _float32_array(daily.get(variable, [])) for variable, column in columns.items()}
+    return dates, values
+
+
+def _float32_array(raw: Sequence[Any]) -> np.ndarray:
+    try:
+        # JSON nulls become NaN here.
+        return np.asarray(raw, dtype=np.float32)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(raw, dtype=object), errors="coerce").to_numpy(np.float32)
+
+
+def daily_frame(payload: Dict[str, Any], columns: Dict[str, str]) -> pd.DataFrame:
+    """Build a ``date`` + value frame from a daily payload; ``columns`` maps API variable to column.
+
+    The typed arrays are wrapped without a copy, so frames built from cached payloads share
+    their (read-only) buffers; copy a frame before editing it in place.
+    """
+    dates, values = daily_arrays(payload, columns)
+    return pd.DataFrame({"date": dates, **values}, copy=False)
+
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: str, fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` once for concurrent callers with the same key; the others share its result."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+    if not owner:
+        return future.result()
+    try:
+        result = fn()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
 
 def format_error(error: Optional[BaseException]) -> Optional[str]:
@@ -57,5 +464,27 @@ def build_source_meta(
         "cached": cached,
         "fallback_used": cache_fallback,
         "cache_fallback": cache_fallback,
-        "error": format_error(error),
+        "error": format_error(error) if error is not None else None,
     }
+
+
+def fetch_for_locations(
+    fetch: Callable[..., Tuple[pd.DataFrame, Dict[str, object]]],
+    locations: Iterable[Location],
+    start_date: date,
+    end_date: date,
+    cache: DiskCache,
+    refresh: bool = False,
+    max_workers: int = MAX_FETCH_WORKERS,
+) -> List[Tuple[pd.DataFrame, Dict[str, object]]]:
+    """Run a per-location fetch for many locations on a thread pool, keeping input order."""
+    locations = list(locations)
+    if not locations:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(locations))) as executor:
+        return list(
+            executor.map(
+                lambda location: fetch(location, start_date, end_date, cache, refresh),
+                locations,
+            )
+        )
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
-import requests
 
 from src.cache import DiskCache
 from src.models import Location
-from src.sources.utils import build_cache_key, build_source_meta
+from src.sources.utils import (
+    ARCHIVE_DAILY_VARIABLES,
+    ARCHIVE_ENDPOINT,
+    MARINE_ENDPOINT,
+    daily_frame,
+    fetch_daily,
+    fetch_daily_many,
+)
 from src.sources.wind_wave_provider import WindWaveProvider
 
+WIND_COLUMNS = {"wind_speed_10m_mean": "wind_ms"}
+WAVE_COLUMNS = {"wave_height_mean": "wave_hs_m"}
+
 
 class OpenMeteoWindWave(WindWaveProvider):
     def fetch(
@@ -21,30 +32,101 @@ class OpenMeteoWindWave(WindWaveProvider):
         cache: DiskCache,
         refresh: bool = False,
     ) -> Tuple[pd.DataFrame, Dict[str, object]]:
-        wind_df, wind_meta = _fetch_wind(location, start_date, end_date, cache, refresh)
-        wave_df, wave_meta = _fetch_wave(location, start_date, end_date, cache, refresh)
-        merged = pd.merge(wind_df, wave_df, on="date", how="outer")
-        fallback_used = bool(wind_meta.get("fallback_used") or wave_meta.get("fallback_used"))
-        cache_fallback = bool(wind_meta.get("cache_fallback") or wave_meta.get("cache_fallback"))
-        errors = [err for err in (wind_meta.get("error"), wave_meta.get("error")) if err]
-        combined_meta = {
-            "source": "open_meteo",
-            "version": "v1",
-            "period": wind_meta.get("period"),
-            "requested_period": wind_meta.get("requested_period"),
-            "actual_period": wind_meta.get("actual_period"),
-            "coordinates": {
-                "wind": wind_meta.get("coordinates"),
-                "wave": wave_meta.get("coordinates"),
-            },
-            "coverage": None,
-            "cached": bool(wind_meta.get("cached") and wave_meta.get("cached")),
-            "fallback_used": fallback_used,
-            "cache_fallback": cache_fallback,
-            "error": errors or None,
-            "components": {"wind": wind_meta, "wave": wave_meta},
-        }
-        return merged, combined_meta
+        # Wind and wave come from different hosts, so fetch them side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wind = executor.submit(_fetch_wind, location, start_date, end_date, cache, refresh)
+            wave = executor.submit(_fetch_wave, location, start_date, end_date, cache, refresh)
+            wind_df, wind_meta = wind.result()
+            wave_df, wave_meta = wave.result()
+        return _merge_wind_wave(wind_df, wave_df), _combined_meta(wind_meta, wave_meta)
+
+    def fetch_many(
+        self,
+        locations: Iterable[Location],
+        start_date: date,
+        end_date: date,
+        cache: DiskCache,
+        refresh: bool = False,
+    ) -> List[Tuple[pd.DataFrame, Dict[str, object]]]:
+        """One archive and one marine request per batch of uncached locations."""
+        locations = list(locations)
+        wind_points = [(location.location_id, location.lat, location.lon) for location in locations]
+        wave_points = [
+            (location.location_id, location.wave_point.lat, location.wave_point.lon)
+            for location in locations
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wind = executor.submit(
+                fetch_daily_many,
+                ARCHIVE_ENDPOINT,
+                "open_meteo_archive",
+                "v1",
+                "archive_daily",
+                wind_points,
+                start_date,
+                end_date,
+                ARCHIVE_DAILY_VARIABLES,
+                cache,
+                refresh,
+            )
+            wave = executor.submit(
+                fetch_daily_many,
+                MARINE_ENDPOINT,
+                "open_meteo_marine",
+                "v1",
+                "wave",
+                wave_points,
+                start_date,
+                end_date,
+                ["wave_height_mean"],
+                cache,
+                refresh,
+            )
+            winds = wind.result()
+            waves = wave.result()
+        return [
+            (
+                _merge_wind_wave(_to_wind_dataframe(wind_payload), _to_wave_dataframe(wave_payload)),
+                _combined_meta(wind_meta, wave_meta),
+            )
+            for (wind_payload, wind_meta), (wave_payload, wave_meta) in zip(winds, waves)
+        ]
+
+
+def _merge_wind_wave(wind_df: pd.DataFrame, wave_df: pd.DataFrame) -> pd.DataFrame:
+    # Inland points and failed marine calls leave one side empty; skip the join for them.
+    if wave_df.empty:
+        return wind_df.assign(wave_hs_m=np.float32(np.nan))
+    if wind_df.empty:
+        return wave_df.assign(wind_ms=np.float32(np.nan))[["date", "wind_ms", "wave_hs_m"]]
+    # Both APIs return the same sorted daily axis for a period, so the join is usually a no-op.
+    if np.array_equal(wind_df["date"].to_numpy(), wave_df["date"].to_numpy()):
+        return wind_df.assign(wave_hs_m=wave_df["wave_hs_m"].to_numpy())
+    # Otherwise join on the (monotonic) date index, which takes pandas' ordered-merge path.
+    return wind_df.set_index("date").join(wave_df.set_index("date"), how="outer").reset_index()
+
+
+def _combined_meta(wind_meta: Dict[str, object], wave_meta: Dict[str, object]) -> Dict[str, object]:
+    fallback_used = bool(wind_meta.get("fallback_used") or wave_meta.get("fallback_used"))
+    cache_fallback = bool(wind_meta.get("cache_fallback") or wave_meta.get("cache_fallback"))
+    errors = [err for err in (wind_meta.get("error"), wave_meta.get("error")) if err]
+    return {
+        "source": "open_meteo",
+        "version": "v1",
+        "period": wind_meta.get("period"),
+        "requested_period": wind_meta.get("requested_period"),
+        "actual_period": wind_meta.get("actual_period"),
+        "coordinates": {
+            "wind": wind_meta.get("coordinates"),
+            "wave": wave_meta.get("coordinates"),
+        },
+        "coverage": None,
+        "cached": bool(wind_meta.get("cached") and wave_meta.get("cached")),
+        "fallback_used": fallback_used,
+        "cache_fallback": cache_fallback,
+        "error": errors or None,
+        "components": {"wind": wind_meta, "wave": wave_meta},
+    }
 
 
 def _fetch_wind(
@@ -54,67 +136,21 @@ def _fetch_wind(
     cache: DiskCache,
     refresh: bool,
 ) -> Tuple[pd.DataFrame, Dict[str, object]]:
-    endpoint = "https://archive-api.open-meteo.com/v1/archive"
-    source_name = "open_meteo_archive"
-    source_version = "v1"
-    params = {
-        "latitude": location.lat,
-        "longitude": location.lon,
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "daily": "wind_speed_10m_mean",
-        "timezone": "UTC",
-    }
-    cache_key = build_cache_key(
-        source_name,
-        source_version,
+    payload, meta = fetch_daily(
+        ARCHIVE_ENDPOINT,
+        "open_meteo_archive",
+        "v1",
+        "archive_daily",
         location.location_id,
         location.lat,
         location.lon,
         start_date,
         end_date,
-        params["daily"],
-    )
-    cached = cache.get("wind", cache_key)
-    if cached and not refresh:
-        return _to_wind_dataframe(cached), build_source_meta(
-            source_name,
-            source_version,
-            start_date,
-            end_date,
-            {"lat": location.lat, "lon": location.lon},
-            cached=True,
-            cache_fallback=False,
-        )
-
-    try:
-        response = requests.get(endpoint, params=params, timeout=60)
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as exc:
-        if cached:
-            return _to_wind_dataframe(cached), build_source_meta(
-                source_name,
-                source_version,
-                start_date,
-                end_date,
-                {"lat": location.lat, "lon": location.lon},
-                cached=True,
-                cache_fallback=True,
-                error=exc,
-            )
-        raise
-
-    cache.set("wind", cache_key, data)
-    return _to_wind_dataframe(data), build_source_meta(
-        source_name,
-        source_version,
-        start_date,
-        end_date,
-        {"lat": location.lat, "lon": location.lon},
-        cached=False,
-        cache_fallback=False,
+        ARCHIVE_DAILY_VARIABLES,
+        cache,
+        refresh,
     )
+    return _to_wind_dataframe(payload), meta
 
 
 def _fetch_wave(
@@ -124,86 +160,26 @@ def _fetch_wave(
     cache: DiskCache,
     refresh: bool,
 ) -> Tuple[pd.DataFrame, Dict[str, object]]:
-    endpoint = "https://marine-api.open-meteo.com/v1/marine"
-    source_name = "open_meteo_marine"
-    source_version = "v1"
-    params = {
-        "latitude": location.wave_point.lat,
-        "longitude": location.wave_point.lon,
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "daily": "wave_height_mean",
-        "timezone": "UTC",
-    }
-    cache_key = build_cache_key(
-        source_name,
-        source_version,
+    payload, meta = fetch_daily(
+        MARINE_ENDPOINT,
+        "open_meteo_marine",
+        "v1",
+        "wave",
         location.location_id,
         location.wave_point.lat,
         location.wave_point.lon,
         start_date,
         end_date,
-        params["daily"],
-    )
-    cached = cache.get("wave", cache_key)
-    if cached and not refresh:
-        return _to_wave_dataframe(cached), build_source_meta(
-            source_name,
-            source_version,
-            start_date,
-            end_date,
-            {"lat": location.wave_point.lat, "lon": location.wave_point.lon},
-            cached=True,
-            cache_fallback=False,
-        )
-
-    try:
-        response = requests.get(endpoint, params=params, timeout=60)
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as exc:
-        if cached:
-            return _to_wave_dataframe(cached), build_source_meta(
-                source_name,
-                source_version,
-                start_date,
-                end_date,
-                {"lat": location.wave_point.lat, "lon": location.wave_point.lon},
-                cached=True,
-                cache_fallback=True,
-                error=exc,
-            )
-        raise
-
-    cache.set("wave", cache_key, data)
-    return _to_wave_dataframe(data), build_source_meta(
-        source_name,
-        source_version,
-        start_date,
-        end_date,
-        {"lat": location.wave_point.lat, "lon": location.wave_point.lon},
-        cached=False,
-        cache_fallback=False,
+        ["wave_height_mean"],
+        cache,
+        refresh,
     )
+    return _to_wave_dataframe(payload), meta
 
 
 def _to_wind_dataframe(payload: Dict[str, object]) -> pd.DataFrame:
-    daily = payload.get("daily", {})
-    dates = daily.get("time", [])
-    wind = daily.get("wind_speed_10m_mean", [])
-    frame = pd.DataFrame({
-        "date": pd.to_datetime(dates),
-        "wind_ms": pd.to_numeric(wind, errors="coerce"),
-    })
-    return frame
+    return daily_frame(payload, WIND_COLUMNS)
 
 
 def _to_wave_dataframe(payload: Dict[str, object]) -> pd.DataFrame:
-    daily = payload.get("daily", {})
-    dates = daily.get("time", [])
-    wave = daily.get("wave_height_mean", [])
-    frame = pd.DataFrame({
-        "date": pd.to_datetime(dates),
-        "wave_hs_m": pd.to_numeric(wave, errors="coerce"),
-    })
-    return frame
+    return daily_frame(payload, WAVE_COLUMNS)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import pandas as pd
 
 from src.cache import DiskCache
 from src.models import Location
+from src.sources.utils import fetch_for_locations
 
 
 class WindWaveProvider(ABC):
@@ -21,3 +22,14 @@ class WindWaveProvider(ABC):
         refresh: bool = False,
     ) -> Tuple[pd.DataFrame, Dict[str, object]]:
         raise NotImplementedError
+
+    def fetch_many(
+        self,
+        locations: Iterable[Location],
+        start_date: date,
+        end_date: date,
+        cache: DiskCache,
+        refresh: bool = False,
+    ) -> List[Tuple[pd.DataFrame, Dict[str, object]]]:
+        """Fetch several locations; results follow the input order."""
+        return fetch_for_locations(self.fetch, locations, start_date, end_date, cache, refresh)
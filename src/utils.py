@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from typing import Optional, TypeVar
 
-def mph_to_ms(value: float) -> float:
-    return value * 0.44704
+import numpy as np
 
+T = TypeVar("T", float, np.ndarray)
 
-def ft_to_m(value: float) -> float:
-    return value * 0.3048
+# Each converter is a single ufunc call, so it takes a scalar or a whole column alike;
+# pass ``out`` (e.g. the input array itself) to convert in place without a temporary.
 
 
-def k_to_c(value: float) -> float:
-    return value - 273.15
+def mph_to_ms(value: T, out: Optional[np.ndarray] = None) -> T:
+    return np.multiply(value, 0.44704, out=out)
+
+
+def ft_to_m(value: T, out: Optional[np.ndarray] = None) -> T:
+    return np.multiply(value, 0.3048, out=out)
+
+
+def k_to_c(value: T, out: Optional[np.ndarray] = None) -> T:
+    return np.subtract(value, 273.15, out=out)
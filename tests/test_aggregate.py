@@ -0,0 +1,42 @@
+import math
+
+import pandas as pd
+
+from src.compute.aggregate import monthly_mean_from_daily, monthly_mean_from_daily_multi
+
+
+def test_monthly_mean_and_coverage():
+    dates = pd.date_range("2004-01-01", "2005-12-31", freq="D")
+    df = pd.DataFrame({"date": dates, "value": dates.month.astype(float)})
+    df.loc[(df["date"].dt.year == 2005) & (df["date"].dt.month == 3), "value"] = math.nan
+
+    means, coverage_ok = monthly_mean_from_daily(df, "value", 0.8, start_year=2004, end_year=2005)
+
+    assert len(means) == 12
+    assert means.loc[2] == 2.0
+    assert means.loc[3] == 3.0
+    assert bool(coverage_ok.loc[2])
+    assert not bool(coverage_ok.loc[3])
+
+
+def test_missing_years_count_against_coverage():
+    dates = pd.date_range("2004-01-01", "2004-12-31", freq="D")
+    df = pd.DataFrame({"date": dates, "value": 1.0})
+
+    _, coverage_ok = monthly_mean_from_daily(df, "value", 0.8, start_year=2003, end_year=2004)
+
+    assert not coverage_ok.any()
+
+
+def test_multi_matches_single_column():
+    dates = pd.date_range("2004-01-01", "2005-12-31", freq="D")
+    df = pd.DataFrame({"date": dates, "wind": dates.day.astype(float), "wave": dates.month / 10})
+    df.loc[df["date"].dt.month == 6, "wave"] = math.nan
+
+    stats = monthly_mean_from_daily_multi(df, ["wind", "wave"], 0.8, start_year=2004, end_year=2005)
+
+    for column in ("wind", "wave"):
+        means, coverage_ok = monthly_mean_from_daily(df, column, 0.8, start_year=2004, end_year=2005)
+        pd.testing.assert_series_equal(stats[column][0], means)
+        pd.testing.assert_series_equal(stats[column][1], coverage_ok)
+    assert not bool(stats["wave"][1].loc[6])
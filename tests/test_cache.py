@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from src.cache import DiskCache
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path, ttl_days=1)
+    payload = {"daily": {"time": ["2001-01-01"], "temperature_2m_max": [30.5, None]}}
+
+    cache.set("air_rain", "key", payload)
+
+    assert cache.get("air_rain", "key") == payload
+    assert cache.get("air_rain", "other") is None
+
+
+def test_cache_ignores_corrupt_entry(tmp_path):
+    cache = DiskCache(tmp_path, ttl_days=1)
+    cache.set("air_rain", "key", {"a": 1})
+    cache._path_for("air_rain", "key").write_bytes(b"{not json")
+
+    assert cache.get("air_rain", "key") is None
+
+
+def test_cache_set_leaves_no_temp_files(tmp_path):
+    cache = DiskCache(tmp_path, ttl_days=1)
+    for value in range(3):
+        cache.set("wind", "key", {"value": value})
+
+    assert cache.get("wind", "key") == {"value": 2}
+    assert [path.suffix for path in (tmp_path / "wind").iterdir()] == [".json"]
+
+
+def test_cache_expires_by_file_mtime(tmp_path):
+    cache = DiskCache(tmp_path, ttl_days=1)
+    cache.set("sea_sst", "key", {"a": 1})
+    path = cache._path_for("sea_sst", "key")
+    stale = path.stat().st_mtime - 2 * 86400
+    os.utime(path, (stale, stale))
+
+    assert cache.get("sea_sst", "key") is None
+
+
+def test_cache_array_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path, ttl_days=1)
+    arrays = {
+        "time": np.array(["2001-01-01", "2001-01-02"], dtype="datetime64[D]"),
+        "temperature_2m_max": np.array([30.5, np.nan], dtype=np.float32),
+    }
+
+    cache.set_arrays("archive_daily", "key", arrays)
+    restored = cache.get_arrays("archive_daily", "key")
+
+    assert list(restored) == ["time", "temperature_2m_max"]
+    for name, values in arrays.items():
+        assert restored[name].dtype == values.dtype
+        np.testing.assert_array_equal(restored[name], values)
+    assert cache.get_arrays("archive_daily", "other") is None
+    cache._path_for("archive_daily", "key", ".npz").write_bytes(b"not a zip")
+    assert cache.get_arrays("archive_daily", "key") is None
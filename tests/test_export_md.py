@@ -0,0 +1,23 @@
+import math
+
+import pandas as pd
+
+from src.report.export_md import _to_markdown
+
+
+def test_to_markdown_pipe_table():
+    df = pd.DataFrame(
+        {
+            "Resort": ["Kata", "Karon"],
+            "Month": [1, 12],
+            "AirTempC": ["+30,8", ""],
+            "ComfortScore": [51.900000000000006, math.nan],
+        }
+    )
+
+    lines = _to_markdown(df).splitlines()
+
+    assert lines[0] == "| Resort | Month | AirTempC | ComfortScore |"
+    assert lines[1] == "|:-------|------:|:---------|-------------:|"
+    assert lines[2] == "| Kata   |     1 | +30,8    |         51,9 |"
+    assert lines[3] == "| Karon  |    12 |          |              |"
@@ -0,0 +1,19 @@
+import math
+
+import pandas as pd
+
+from src.formatting import format_series_with_flag, format_with_flag
+
+
+def test_format_series_matches_scalar():
+    values = pd.Series([27.25, 3.0, math.nan, -0.04, 12.96])
+    flags = pd.Series([0, 1, 1, 1, 0])
+
+    for decimals in (0, 1):
+        expected = [format_with_flag(v, f, decimals=decimals) for v, f in zip(values, flags)]
+        assert format_series_with_flag(values, flags, decimals=decimals).tolist() == expected
+
+
+def test_format_series_flag_prefix():
+    result = format_series_with_flag(pd.Series([1.25, math.nan]), pd.Series([1, 1]))
+    assert result.tolist() == ["+1,2", ""]
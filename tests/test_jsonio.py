@@ -0,0 +1,19 @@
+import pytest
+
+from src import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_provenance_shape(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    provenance = {"coverage": {"air": {1: True, 12: False}}, "resort": "Ко Самуи"}
+    raw = jsonio.dumps(provenance, indent=True)
+
+    assert isinstance(raw, bytes)
+    assert "Ко Самуи".encode("utf-8") in raw
+    assert b"\n  " in raw
+    assert jsonio.loads(raw) == {"coverage": {"air": {"1": True, "12": False}}, "resort": "Ко Самуи"}
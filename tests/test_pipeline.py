@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src import jsonio
+from src.cache import DiskCache
+from src.models import Location, Params, WavePoint
+from src.pipeline import _build_marks_detail, _table_payload, build_monthly_table, load_params
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+LOCATION = Location("loc", "C", "R", "A", 1.0, 2.0, WavePoint("offshore", 1.0, 2.0))
+SOURCES_CFG = {
+    "period": {"start_year": 2001, "end_year": 2001},
+    "coverage": {"min_coverage": 0.8},
+    "cache": {"ttl_days": 1},
+    "sources": {
+        "air_rain": {"primary": "fake", "fallbacks": []},
+        "sea_temp": {"primary": "fake", "fallbacks": []},
+        "wind_wave": {"primary": "fake", "fallbacks": []},
+    },
+    "fallbacks": {},
+}
+
+
+def _fake_providers():
+    dates = pd.date_range("2001-01-01", "2001-12-31", freq="D")
+
+    def meta(source):
+        return {"source": source, "cached": False, "error": None}
+
+    def air_rain(location, start_date, end_date, cache, refresh):
+        frame = pd.DataFrame({"date": dates, "tmax_c": 30.0, "prcp_mm": (dates.day % 4 == 0) * 5.0})
+        return frame, meta("fake_air")
+
+    def sea(location, start_date, end_date, cache, refresh):
+        return pd.DataFrame({"date": dates, "sst_c": 28.0}), meta("fake_sea")
+
+    class _WindWave:
+        def fetch(self, location, start_date, end_date, cache, refresh=False):
+            frame = pd.DataFrame({"date": dates, "wind_ms": 4.0, "wave_hs_m": 0.6})
+            wind_wave_meta = meta("fake_wind_wave")
+            wind_wave_meta["components"] = {"wind": meta("fake_wind"), "wave": meta("fake_wave")}
+            return frame, wind_wave_meta
+
+    return {
+        "air_rain": {"fake": air_rain},
+        "sea_temp": {"fake": sea},
+        "wind_wave": {"fake": _WindWave()},
+    }
+
+
+def _build(tmp_path, params, export_md=False):
+    return build_monthly_table(
+        LOCATION,
+        SOURCES_CFG,
+        params,
+        cache_dir=tmp_path / "cache",
+        outputs_dir=tmp_path / "out",
+        export_md=export_md,
+        cache=DiskCache(tmp_path / "cache"),
+        providers=_fake_providers(),
+    )
+
+
+def test_marks_detail_keyed_by_calendar_month():
+    months = pd.Index(range(1, 13), name="Month")
+    df = pd.DataFrame({"Month": list(months)})
+    for col in ("mark_air", "mark_sea", "mark_rain", "mark_wind", "mark_wave"):
+        df[col] = 0
+    df.loc[0, "mark_rain"] = 1
+    df.loc[1, "mark_wave"] = 1
+    df.loc[11, "mark_air"] = 1
+
+    rain_estimated = pd.Series(False, index=months)
+    rain_estimated.loc[1] = True
+    last_resort = {
+        name: pd.Series(False, index=months)
+        for name in ("AirTempC", "SeaTempC", "RainDays", "Wind_ms", "WaveHs_m")
+    }
+    last_resort["WaveHs_m"].loc[2] = True
+
+    marks = _build_marks_detail(df, rain_estimated, 0.8, last_resort)
+
+    assert list(marks) == [str(month) for month in months]
+    assert marks["1"] == [{"metric": "RainDays", "reason": "estimated_from_total"}]
+    assert marks["2"] == [{"metric": "WaveHs_m", "reason": "last_resort_estimate"}]
+    assert marks["12"] == [{"metric": "AirTempC", "reason": "coverage_below_0.8"}]
+
+
+def test_table_payload_roundtrip_keeps_dtypes():
+    df = pd.DataFrame(
+        {
+            "Month": [1, 2],
+            "AirTempC": ["+30,1", ""],
+            "AirTempC_num": np.array([30.1, np.nan], dtype=np.float32),
+            "mark_air": np.array([1, 0], dtype=np.int8),
+            "Score": [71.25, 64.0],
+        }
+    )
+    payload = jsonio.loads(jsonio.dumps(_table_payload(df)))
+    restored = pd.DataFrame(payload["data"], columns=payload["columns"])
+    restored = restored.astype(dict(zip(payload["columns"], payload["dtypes"])))
+
+    pd.testing.assert_frame_equal(restored, df)
+
+
+def test_build_writes_markdown_export(tmp_path):
+    params = load_params(CONFIG_DIR / "params.yaml")
+
+    df, _, csv_path, md_path = _build(tmp_path, params, export_md=True)
+
+    assert csv_path.exists()
+    lines = md_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("| Country | Resort | Area | Month |")
+    assert len(lines) == 2 + len(df)
+
+
+def test_cached_result_rewrites_outputs_for_its_own_params(tmp_path):
+    params_a = load_params(CONFIG_DIR / "params.yaml")
+    params_b = Params(score=params_a.score, thresholds={**params_a.thresholds, "S0": 24.0})
+
+    df_a, fresh_provenance_a, csv_path, md_path = _build(tmp_path, params_a, export_md=True)
+    outputs_a = [path.read_bytes() for path in (csv_path, md_path)]
+    prov_path = csv_path.with_name(csv_path.name.replace("_monthly.csv", "_provenance.json"))
+    provenance_a = jsonio.loads(prov_path.read_bytes())
+    df_b, _, _, _ = _build(tmp_path, params_b, export_md=True)
+    assert not df_b["Score"].equals(df_a["Score"])
+
+    df, provenance, _, _ = _build(tmp_path, params_a, export_md=True)
+
+    pd.testing.assert_frame_equal(df, df_a)
+    assert [path.read_bytes() for path in (csv_path, md_path)] == outputs_a
+    assert jsonio.loads(prov_path.read_bytes()) == provenance_a
+    assert provenance == fresh_provenance_a
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from src.score.comfort import compute_score
+from src.models import Thresholds
+from src.score.comfort import compute_score, compute_score_vec
 
 
 def test_clamp_score():
@@ -63,3 +65,80 @@ def test_reasonable_score():
     assert 40 <= score <= 100
     assert "SeaBase" in components
     assert "Score_raw" in components
+
+
+def test_vectorized_score_matches_scalar():
+    params = {
+        "score": {"clamp_min": 0, "clamp_max": 100},
+        "thresholds": {
+            "dS": 4.0,
+            "S0": 20.0,
+            "S4": 30.0,
+            "WindColdT": 8.0,
+            "ColdAirT": 22.0,
+            "HeatAirT": 33.0,
+            "BreezeW0": 2.0,
+            "BreezeW1": 6.0,
+            "BreezeRamp": 2.0,
+            "RainT1": 5.0,
+            "RainT2": 15.0,
+            "CalmWindT": 2.0,
+            "BreathAirT": 30.0,
+            "BreathRainT": 12.0,
+            "BreathWindT": 3.0,
+            "StrongWindT": 10.0,
+            "WaveT1": 0.5,
+            "WaveT2": 1.2,
+            "WaveT3": 2.0,
+        },
+    }
+    rng = np.random.default_rng(7)
+    n = 500
+    air = rng.uniform(10, 40, n)
+    sea = rng.uniform(15, 32, n)
+    rain = rng.uniform(0, 25, n)
+    wind = rng.uniform(0, 14, n)
+    wave = rng.uniform(0, 2.5, n)
+
+    scores, components = compute_score_vec(air, sea, rain, wind, wave, params)
+
+    for i in range(n):
+        score, expected = compute_score(air[i], sea[i], rain[i], wind[i], wave[i], params)
+        assert scores[i] == pytest.approx(score)
+        for name, value in expected.items():
+            assert components[name][i] == pytest.approx(value)
+
+
+def test_compiled_thresholds_match_dict():
+    params = {
+        "score": {"clamp_min": 0, "clamp_max": 100},
+        "thresholds": {
+            "dS": 4.0,
+            "S0": 20.0,
+            "S4": 30.0,
+            "WindColdT": 8.0,
+            "ColdAirT": 22.0,
+            "HeatAirT": 33.0,
+            "BreezeW0": 2.0,
+            "BreezeW1": 6.0,
+            "BreezeRamp": 2.0,
+            "RainT1": 5.0,
+            "RainT2": 15.0,
+            "CalmWindT": 2.0,
+            "BreathAirT": 30.0,
+            "BreathRainT": 12.0,
+            "BreathWindT": 3.0,
+            "StrongWindT": 10.0,
+            "WaveT1": 0.5,
+            "WaveT2": 1.2,
+            "WaveT3": 2.0,
+            "SeaMax": 28.0,
+        },
+    }
+    compiled = {
+        "score": params["score"],
+        "thresholds": Thresholds.from_dict(params["thresholds"]),
+    }
+
+    assert compute_score(28, 27, 6, 4, 0.8, compiled) == compute_score(28, 27, 6, 4, 0.8, params)
+    assert compute_score(34, 29, 13, 1, 1.5, compiled) == compute_score(34, 29, 13, 1, 1.5, params)
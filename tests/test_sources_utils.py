@@ -0,0 +1,326 @@
+import os
+import threading
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cache import DiskCache
+from src.models import Location, WavePoint
+from src.sources.air_rain_meteostat import fetch_air_rain_daily_batch
+from src.sources.wind_wave_openmeteo import _merge_wind_wave
+from src.sources.utils import (
+    ARCHIVE_DAILY_VARIABLES,
+    HTTP_RETRY,
+    MEMORY_CACHE_TTL_SECONDS,
+    _memory_get,
+    _memory_put,
+    _single_flight,
+    build_cache_key,
+    daily_arrays,
+    daily_frame,
+    fetch_daily,
+    fetch_daily_many,
+    get_session,
+)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Serve source requests from a canned response; returns the list of recorded request kwargs.
+
+    ``status`` may be a callable taking the request kwargs, e.g. to answer conditional requests.
+    """
+
+    def install(body=b"", status=200, headers=None):
+        calls = []
+
+        class _Session:
+            def get(self, url, **kwargs):
+                calls.append(kwargs)
+                code = status(kwargs) if callable(status) else status
+                return _FakeResponse(code, body, headers or {})
+
+        monkeypatch.setattr("src.sources.utils.get_session", lambda: _Session())
+        return calls
+
+    return install
+
+
+def test_session_is_shared_and_retries():
+    session = get_session()
+
+    assert get_session() is session
+    adapter = session.get_adapter("https://archive-api.open-meteo.com/v1/archive")
+    assert adapter.max_retries is HTTP_RETRY
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_batch_fetch_keeps_location_order(tmp_path):
+    cache = DiskCache(tmp_path)
+    start, end = date(2020, 1, 1), date(2020, 1, 2)
+    locations = []
+    for index in range(5):
+        location = Location(f"loc{index}", "C", "R", "A", float(index), 0.0, WavePoint("offshore", 0.0, 0.0))
+        key = build_cache_key(
+            "open_meteo_archive",
+            "v1",
+            location.location_id,
+            location.lat,
+            location.lon,
+            start,
+            end,
+            ",".join(ARCHIVE_DAILY_VARIABLES),
+        )
+        columns = {
+            "time": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]"),
+            "temperature_2m_max": np.array([index, index], dtype=np.float32),
+            "precipitation_sum": np.array([0.0, 1.0], dtype=np.float32),
+            "wind_speed_10m_mean": np.array([3.0, 4.0], dtype=np.float32),
+        }
+        cache.set_arrays("archive_daily", key, columns)
+        locations.append(location)
+
+    results = fetch_air_rain_daily_batch(locations, start, end, cache)
+
+    assert [df["tmax_c"].iloc[0] for df, _ in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert all(meta["cached"] for _, meta in results)
+
+
+def test_single_flight_shares_one_call():
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"daily": {}}
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(_single_flight("k", slow))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4
+
+
+def test_cache_key_extras_are_order_independent():
+    args = ("src", "v1", "loc", 1.0, 2.0, date(2020, 1, 1), date(2020, 1, 2), ["a", "b"])
+
+    plain = build_cache_key(*args)
+    first = build_cache_key(*args, models="era5", cell_selection="sea")
+    second = build_cache_key(*args, cell_selection="sea", models="era5")
+
+    assert plain == "src:v1:loc:1.0:2.0:2020-01-01:2020-01-02:a,b:units=metric"
+    assert first == second
+    assert first.startswith(plain + ":")
+    assert build_cache_key(*args, models="ecmwf") != first
+
+
+def test_daily_arrays_parse_dates_and_nulls():
+    payload = {"daily": {"time": ["2020-01-01", "2020-01-02"], "precipitation_sum": [1.5, None]}}
+
+    dates, values = daily_arrays(payload, {"precipitation_sum": "prcp_mm"})
+
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert dates[1] == np.datetime64("2020-01-02")
+    assert values["prcp_mm"].dtype == np.float32
+    assert values["prcp_mm"][0] == 1.5
+    assert np.isnan(values["prcp_mm"][1])
+
+
+def test_daily_frame_wraps_typed_columns():
+    payload = {
+        "daily": {
+            "time": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]"),
+            "precipitation_sum": np.array([1.5, np.nan], dtype=np.float32),
+        }
+    }
+
+    df = daily_frame(payload, {"precipitation_sum": "prcp_mm"})
+
+    assert list(df.columns) == ["date", "prcp_mm"]
+    assert df["date"].dtype.kind == "M"
+    assert df["prcp_mm"].dtype == np.float32
+    assert np.shares_memory(df["prcp_mm"].to_numpy(), payload["daily"]["precipitation_sum"])
+
+
+def test_refresh_with_invalid_body_falls_back_to_cache(tmp_path, fake_session):
+    fake_session(b"<html>busy</html>")
+    cache = DiskCache(tmp_path)
+    start, end = date(2020, 1, 1), date(2020, 1, 1)
+    key = build_cache_key("src", "v1", "loc", 1.0, 2.0, start, end, "x")
+    cache.set_arrays("ns", key, {"time": np.array(["2020-01-01"], dtype="datetime64[D]"), "x": np.ones(1, np.float32)})
+
+    payload, meta = fetch_daily(
+        "https://example.invalid", "src", "v1", "ns", "loc", 1.0, 2.0, start, end, ["x"], cache, refresh=True
+    )
+
+    assert payload["daily"]["x"].tolist() == [1.0]
+    assert meta["cache_fallback"]
+    assert meta["error"].startswith("InvalidJSONError")
+
+
+def test_download_is_cached_as_typed_columns(tmp_path, fake_session):
+    calls = fake_session(b'{"daily": {"time": ["2020-01-01", "2020-01-02"], "x": [1.5, null], "y": [2.0, 3.0]}}')
+    cache = DiskCache(tmp_path)
+    start, end = date(2020, 1, 1), date(2020, 1, 2)
+    args = ("https://example.invalid", "src", "v1", "ns", "loc", 1.0, 2.0, start, end, ["x"], cache)
+
+    fresh, _ = fetch_daily(*args)
+    cached, meta = fetch_daily(*args)
+
+    assert [call["params"]["daily"] for call in calls] == ["x"]
+    assert meta["cached"]
+    assert sorted(cached["daily"]) == ["time", "x"]
+    assert cached["daily"]["time"].dtype == np.dtype("datetime64[D]")
+    np.testing.assert_array_equal(cached["daily"]["x"], fresh["daily"]["x"])
+    assert cached["daily"]["x"].dtype == np.float32
+
+    for path in (tmp_path / "ns").iterdir():
+        path.unlink()
+    again, meta = fetch_daily(*args)
+
+    assert len(calls) == 1
+    assert meta["cached"]
+    assert not again["daily"]["x"].flags.writeable
+
+
+def test_refresh_sends_validators_and_reuses_cache_on_304(tmp_path, fake_session):
+    calls = fake_session(
+        b'{"daily": {"time": ["2020-01-01"], "x": [1.5]}}',
+        status=lambda request: 304 if request["headers"] else 200,
+        headers={"Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT", "ETag": '"abc"'},
+    )
+    cache = DiskCache(tmp_path)
+    start, end = date(2020, 1, 1), date(2020, 1, 1)
+    args = ("https://example.invalid", "src", "v2", "ns", "loc", 1.0, 2.0, start, end, ["x"], cache)
+
+    fresh, _ = fetch_daily(*args)
+    again, meta = fetch_daily(*args, refresh=True)
+
+    assert [call["headers"] for call in calls] == [
+        {},
+        {"If-Modified-Since": "Wed, 01 Jan 2020 00:00:00 GMT", "If-None-Match": '"abc"'},
+    ]
+    assert meta["cached"] and not meta["cache_fallback"]
+    assert again["daily"]["x"] is fresh["daily"]["x"]
+
+
+def test_fetch_many_batches_uncached_points(tmp_path, fake_session):
+    calls = fake_session(
+        b'[{"daily": {"time": ["2020-01-01"], "x": [1.0]}},'
+        b' {"daily": {"time": ["2020-01-01"], "x": [3.0]}}]',
+        headers={"Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT", "ETag": '"batch"'},
+    )
+    cache = DiskCache(tmp_path)
+    start, end = date(2020, 1, 1), date(2020, 1, 1)
+    key = build_cache_key("src", "v3", "b", 2.0, 0.0, start, end, "x")
+    cache.set_arrays("ns", key, {"time": np.array(["2020-01-01"], dtype="datetime64[D]"), "x": np.full(1, 2.0, np.float32)})
+    points = [("a", 1.0, 0.0), ("b", 2.0, 0.0), ("c", 3.0, 0.0)]
+
+    results = fetch_daily_many("https://example.invalid", "src", "v3", "ns", points, start, end, ["x"], cache)
+
+    assert [call["params"]["latitude"] for call in calls] == ["1.0,3.0"]
+    assert [payload["daily"]["x"][0] for payload, _ in results] == [1.0, 2.0, 3.0]
+    assert [meta["cached"] for _, meta in results] == [False, True, False]
+
+    payload, meta = fetch_daily("https://example.invalid", "src", "v3", "ns", "c", 3.0, 0.0, start, end, ["x"], cache)
+
+    assert len(calls) == 1
+    assert meta["cached"] and payload["daily"]["x"][0] == 3.0
+    key_c = build_cache_key("src", "v3", "c", 3.0, 0.0, start, end, "x")
+    assert cache.get("ns", key_c) == {"Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}
+
+
+def test_merge_wind_wave_with_empty_wave_side():
+    wind = pd.DataFrame(
+        {
+            "date": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]"),
+            "wind_ms": np.array([3.0, 4.0], dtype=np.float32),
+        }
+    )
+    wave = pd.DataFrame({"date": np.array([], dtype="datetime64[D]"), "wave_hs_m": np.array([], dtype=np.float32)})
+
+    merged = _merge_wind_wave(wind, wave)
+
+    assert list(merged.columns) == ["date", "wind_ms", "wave_hs_m"]
+    assert merged["wind_ms"].tolist() == [3.0, 4.0]
+    assert merged["wave_hs_m"].isna().all()
+    assert merged["wave_hs_m"].dtype == np.float32
+
+
+def test_merge_wind_wave_outer_joins_on_date():
+    wind = pd.DataFrame(
+        {
+            "date": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]"),
+            "wind_ms": np.array([3.0, 4.0], dtype=np.float32),
+        }
+    )
+    wave = pd.DataFrame(
+        {
+            "date": np.array(["2020-01-02", "2020-01-03"], dtype="datetime64[D]"),
+            "wave_hs_m": np.array([0.5, 0.7], dtype=np.float32),
+        }
+    )
+
+    merged = _merge_wind_wave(wind, wave)
+    aligned = _merge_wind_wave(wind, wind.rename(columns={"wind_ms": "wave_hs_m"}))
+
+    assert list(merged.columns) == ["date", "wind_ms", "wave_hs_m"]
+    assert merged["date"].dt.day.tolist() == [1, 2, 3]
+    np.testing.assert_allclose(merged["wind_ms"], [3.0, 4.0, np.nan], rtol=1e-6)
+    np.testing.assert_allclose(merged["wave_hs_m"], [np.nan, 0.5, 0.7], rtol=1e-6)
+    assert aligned["wave_hs_m"].tolist() == [3.0, 4.0]
+
+
+def test_expired_entry_is_revalidated_instead_of_downloaded(tmp_path, fake_session):
+    calls = fake_session(status=304)
+    cache = DiskCache(tmp_path, ttl_days=1)
+    start, end = date(2020, 1, 1), date(2020, 1, 1)
+    key = build_cache_key("src", "v4", "loc", 1.0, 2.0, start, end, "x")
+    cache.set_arrays("ns", key, {"time": np.array(["2020-01-01"], dtype="datetime64[D]"), "x": np.ones(1, np.float32)})
+    cache.set("ns", key, {"ETag": '"v1"'})
+    stale = time.time() - 2 * 86400
+    for suffix in (".npz", ".json"):
+        os.utime(cache._path_for("ns", key, suffix), (stale, stale))
+
+    payload, meta = fetch_daily("https://example.invalid", "src", "v4", "ns", "loc", 1.0, 2.0, start, end, ["x"], cache)
+
+    assert [call["headers"] for call in calls] == [{"If-None-Match": '"v1"'}]
+    assert meta["cached"]
+    assert payload["daily"]["x"].tolist() == [1.0]
+    assert cache.get_arrays("ns", key) is not None
+
+
+def test_memory_entries_expire(monkeypatch):
+    key = ("dir", "ns", "memory-ttl")
+    columns = {"x": np.ones(1, np.float32)}
+    now = [1000.0]
+    monkeypatch.setattr("src.sources.utils.time.monotonic", lambda: now[0])
+
+    _memory_put(key, columns)
+
+    assert _memory_get(key) is columns
+    now[0] += MEMORY_CACHE_TTL_SECONDS + 1
+    assert _memory_get(key) is None
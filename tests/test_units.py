@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.utils import ft_to_m, k_to_c, mph_to_ms
 
 
@@ -11,3 +13,14 @@ def test_ft_to_m():
 
 def test_k_to_c():
     assert round(k_to_c(273.15), 2) == 0.0
+
+
+def test_converters_work_in_place_on_arrays():
+    values = np.array([10.0, 20.0], dtype=np.float32)
+
+    converted = mph_to_ms(values, out=values)
+
+    assert converted is values
+    assert values.dtype == np.float32
+    np.testing.assert_allclose(values, [4.4704, 8.9408], rtol=1e-6)
+    np.testing.assert_allclose(k_to_c(np.array([273.15, 300.15])), [0.0, 27.0])